@@ -36,9 +36,7 @@ def cmd_build_from_prompt(args):
         output_path = Path(args.out)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        json_data = world.to_json()
-        with open(output_path, "w") as f:
-            f.write(json_data)
+        world.write_json(output_path, indent=2)
 
         print(f"✓ World built successfully!")
         print(f"  Title: {world.metadata.title}")
@@ -66,9 +64,7 @@ def cmd_build_from_json(args):
 
     try:
         # Load the world
-        with open(input_path) as f:
-            json_data = f.read()
-        world = WDLWorld.from_json(json_data)
+        world = WDLWorld.read_json(input_path)
 
         print(f"✓ World loaded: {world.metadata.title}")
         print(f"  Entities: {len(world.entities)}")
@@ -6,6 +6,8 @@ from enum import Enum
 
 from omniworld_builder.core.wdl_schema import (
     EntityType,
+    Vector3,
+    WDLEntity,
     WDLWorld,
 )
 
@@ -50,103 +52,149 @@ class ValidationResult:
         return [i for i in self.issues if i.severity == ValidationSeverity.WARNING]
 
 
+@dataclass
+class ValidationContext:
+    """Per-world data shared by entity rules during a single validation pass.
+
+    Values that several rules need, such as the set of entity IDs and the
+    world bounds, are computed once up front instead of once per rule.
+    """
+
+    world: WDLWorld
+    entity_ids: set[str]
+    min_bounds: Vector3
+    max_bounds: Vector3
+    seen_ids: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_world(cls, world: WDLWorld) -> "ValidationContext":
+        """Precompute the shared validation data for a world."""
+        return cls(
+            world=world,
+            entity_ids={entity.id for entity in world.entities},
+            min_bounds=world.bounds.min_bounds,
+            max_bounds=world.bounds.max_bounds,
+        )
+
+
+EntityRule = Callable[[WDLEntity, ValidationContext], list[ValidationIssue]]
+ContextRule = Callable[[ValidationContext], list[ValidationIssue]]
+WorldRule = Callable[[WDLWorld], list[ValidationIssue]]
+
+
 class WDLValidator:
-    """Validator for WDL worlds."""
+    """Validator for WDL worlds.
+
+    Entity rules run together in a single walk over ``world.entities``;
+    whole-world rules run once each. All rules share one
+    :class:`ValidationContext`. Issues are reported grouped by rule, in rule
+    order: built-in rules, then custom entity rules, then custom world rules.
+    """
 
     def __init__(self) -> None:
         """Initialize the validator with default rules."""
-        self._rules: list[Callable[[WDLWorld], list[ValidationIssue]]] = [
-            self._validate_unique_entity_ids,
-            self._validate_parent_references,
-            self._validate_entity_bounds,
-            self._validate_light_settings,
-            self._validate_system_references,
-            self._validate_physics_settings,
+        # Each rule is paired with whether it runs per entity (an EntityRule)
+        # or once per world (a ContextRule).
+        self._checks: list[tuple[Callable[..., list[ValidationIssue]], bool]] = [
+            (self._validate_unique_entity_id, True),
+            (self._validate_parent_reference, True),
+            (self._validate_entity_bounds, True),
+            (self._validate_light_settings, False),
+            (self._validate_system_references, False),
+            (self._validate_physics_settings, True),
         ]
+        self._rules: list[WorldRule] = []
 
     def validate(self, world: WDLWorld) -> ValidationResult:
         """Validate a WDL world against all rules."""
         result = ValidationResult(is_valid=True)
+        context = ValidationContext.from_world(world)
+
+        entity_rules = [rule for rule, per_entity in self._checks if per_entity]
+        entity_issues: list[list[ValidationIssue]] = [[] for _ in entity_rules]
+        for entity in world.entities:
+            for entity_rule, issues in zip(entity_rules, entity_issues):
+                issues.extend(entity_rule(entity, context))
+
+        collected = iter(entity_issues)
+        for rule, per_entity in self._checks:
+            for issue in next(collected) if per_entity else rule(context):
+                result.add_issue(issue)
 
-        for rule in self._rules:
-            issues = rule(world)
-            for issue in issues:
+        for custom_rule in self._rules:
+            for issue in custom_rule(world):
                 result.add_issue(issue)
 
         return result
 
-    def add_rule(self, rule: Callable[[WDLWorld], list[ValidationIssue]]) -> None:
+    def add_rule(self, rule: WorldRule) -> None:
         """Add a custom validation rule."""
         self._rules.append(rule)
 
-    def _validate_unique_entity_ids(self, world: WDLWorld) -> list[ValidationIssue]:
-        """Ensure all entity IDs are unique."""
-        issues: list[ValidationIssue] = []
-        seen_ids: set[str] = set()
-
-        for entity in world.entities:
-            if entity.id in seen_ids:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Duplicate entity ID: {entity.id}",
-                        entity_id=entity.id,
-                    )
+    def add_entity_rule(self, rule: EntityRule) -> None:
+        """Add a custom validation rule that runs once per entity."""
+        self._checks.append((rule, True))
+
+    def _validate_unique_entity_id(
+        self, entity: WDLEntity, context: ValidationContext
+    ) -> list[ValidationIssue]:
+        """Ensure the entity's ID was not used by an earlier entity."""
+        if entity.id in context.seen_ids:
+            return [
+                ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Duplicate entity ID: {entity.id}",
+                    entity_id=entity.id,
                 )
-            seen_ids.add(entity.id)
-
-        return issues
-
-    def _validate_parent_references(self, world: WDLWorld) -> list[ValidationIssue]:
-        """Ensure parent references point to existing entities."""
-        issues: list[ValidationIssue] = []
-        entity_ids = {entity.id for entity in world.entities}
-
-        for entity in world.entities:
-            if entity.parent_id is not None and entity.parent_id not in entity_ids:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Entity '{entity.name}' references non-existent parent: {entity.parent_id}",
-                        entity_id=entity.id,
-                        field_path="parent_id",
-                    )
+            ]
+        context.seen_ids.add(entity.id)
+        return []
+
+    def _validate_parent_reference(
+        self, entity: WDLEntity, context: ValidationContext
+    ) -> list[ValidationIssue]:
+        """Ensure the parent reference points to an existing entity."""
+        if entity.parent_id is not None and entity.parent_id not in context.entity_ids:
+            return [
+                ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Entity '{entity.name}' references non-existent parent: {entity.parent_id}",
+                    entity_id=entity.id,
+                    field_path="parent_id",
                 )
-
-        return issues
-
-    def _validate_entity_bounds(self, world: WDLWorld) -> list[ValidationIssue]:
-        """Check if entities are within world bounds."""
-        issues: list[ValidationIssue] = []
-        min_b = world.bounds.min_bounds
-        max_b = world.bounds.max_bounds
-
-        for entity in world.entities:
-            pos = entity.transform.position
-            if (
-                pos.x < min_b.x
-                or pos.x > max_b.x
-                or pos.y < min_b.y
-                or pos.y > max_b.y
-                or pos.z < min_b.z
-                or pos.z > max_b.z
-            ):
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=f"Entity '{entity.name}' is outside world bounds",
-                        entity_id=entity.id,
-                        field_path="transform.position",
-                    )
+            ]
+        return []
+
+    def _validate_entity_bounds(
+        self, entity: WDLEntity, context: ValidationContext
+    ) -> list[ValidationIssue]:
+        """Check if the entity is within world bounds."""
+        min_b = context.min_bounds
+        max_b = context.max_bounds
+        pos = entity.transform.position
+        if (
+            pos.x < min_b.x
+            or pos.x > max_b.x
+            or pos.y < min_b.y
+            or pos.y > max_b.y
+            or pos.z < min_b.z
+            or pos.z > max_b.z
+        ):
+            return [
+                ValidationIssue(
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Entity '{entity.name}' is outside world bounds",
+                    entity_id=entity.id,
+                    field_path="transform.position",
                 )
+            ]
+        return []
 
-        return issues
-
-    def _validate_light_settings(self, world: WDLWorld) -> list[ValidationIssue]:
+    def _validate_light_settings(self, context: ValidationContext) -> list[ValidationIssue]:
         """Validate light configuration."""
         issues: list[ValidationIssue] = []
 
-        for light in world.lights:
+        for light in context.world.lights:
             if light.intensity > 100:
                 issues.append(
                     ValidationIssue(
@@ -158,12 +206,12 @@ class WDLValidator:
 
         return issues
 
-    def _validate_system_references(self, world: WDLWorld) -> list[ValidationIssue]:
+    def _validate_system_references(self, context: ValidationContext) -> list[ValidationIssue]:
         """Validate that systems reference existing entities."""
         issues: list[ValidationIssue] = []
-        entity_ids = {entity.id for entity in world.entities}
+        entity_ids = context.entity_ids
 
-        for system in world.systems:
+        for system in context.world.systems:
             for interaction in system.interactions:
                 if (
                     interaction.target_entity_id is not None
@@ -179,31 +227,32 @@ class WDLValidator:
 
         return issues
 
-    def _validate_physics_settings(self, world: WDLWorld) -> list[ValidationIssue]:
-        """Validate physics settings for entities."""
+    def _validate_physics_settings(
+        self, entity: WDLEntity, context: ValidationContext
+    ) -> list[ValidationIssue]:
+        """Validate physics settings for the entity."""
         issues: list[ValidationIssue] = []
 
-        for entity in world.entities:
-            if entity.physics.enabled and entity.physics.mass == 0:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=f"Entity '{entity.name}' has physics enabled but zero mass",
-                        entity_id=entity.id,
-                        field_path="physics.mass",
-                    )
+        if entity.physics.enabled and entity.physics.mass == 0:
+            issues.append(
+                ValidationIssue(
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Entity '{entity.name}' has physics enabled but zero mass",
+                    entity_id=entity.id,
+                    field_path="physics.mass",
                 )
-
-            # Check if dynamic objects have physics enabled
-            if entity.entity_type == EntityType.DYNAMIC_OBJECT and not entity.physics.enabled:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.INFO,
-                        message=f"Dynamic object '{entity.name}' does not have physics enabled",
-                        entity_id=entity.id,
-                        field_path="physics.enabled",
-                    )
+            )
+
+        # Check if dynamic objects have physics enabled
+        if entity.entity_type == EntityType.DYNAMIC_OBJECT and not entity.physics.enabled:
+            issues.append(
+                ValidationIssue(
+                    severity=ValidationSeverity.INFO,
+                    message=f"Dynamic object '{entity.name}' does not have physics enabled",
+                    entity_id=entity.id,
+                    field_path="physics.enabled",
                 )
+            )
 
         return issues
 
@@ -4,37 +4,235 @@ WDL is the core Intermediate Representation (IR) for describing 3D worlds
 that can be translated to Unity, Unreal Engine, and Meta Horizon Worlds.
 """
 
+import itertools
+import os
+import secrets
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
-from uuid import uuid4
+from pathlib import Path
+from typing import Annotated, Any, ClassVar, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional extra; only the msgpack path needs it
+    msgspec = None  # type: ignore[assignment]
 
-class Vector3(BaseModel):
+_msgpack_encoder = msgspec.msgpack.Encoder() if msgspec is not None else None
+_msgpack_decoder = msgspec.msgpack.Decoder() if msgspec is not None else None
+
+
+# Entity and system ids are UUID4-formatted strings. Rather than reading
+# os.urandom for every id, each process draws one random 64-bit prefix and
+# fills the low half from a counter, with the version and variant bits set
+# so the ids still parse as version 4 UUIDs. Forked children draw a new prefix.
+_ID_VARIANT_BITS = 0x8000_0000_0000_0000
+_id_prefix: int
+_id_counter: Iterator[int]
+
+
+def _seed_ids() -> None:
+    """Draw a fresh id prefix and restart the id counter."""
+    global _id_prefix, _id_counter
+    _id_prefix = ((secrets.randbits(64) & ~0xF000) | 0x4000) << 64 | _ID_VARIANT_BITS
+    _id_counter = itertools.count()
+
+
+_seed_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_seed_ids)
+
+
+def _new_id() -> str:
+    """Generate a process-unique id in UUID4 string form."""
+    hex_id = f"{_id_prefix | next(_id_counter):032x}"
+    return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+
+
+def _field_error(
+    owner: type, name: str, error_type: str, value: Any, ctx: dict[str, Any] | None = None
+) -> ValidationError:
+    """Build a single-error ValidationError for a field of a dataclass model."""
+    line_error: Any = {"type": error_type, "loc": (name,), "input": value}
+    if ctx is not None:
+        line_error["ctx"] = ctx
+    return ValidationError.from_exception_data(owner.__name__, [line_error])
+
+
+def _coerce_float(owner: type, name: str, value: Any) -> float:
+    """Convert a field value to float the way a Pydantic ``float`` field would."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        error_type = "float_parsing" if isinstance(value, str | bytes) else "float_type"
+        raise _field_error(owner, name, error_type, value) from None
+
+
+_ModelT = TypeVar("_ModelT", bound="_DataclassModel")
+
+
+class _DataclassModel:
+    """``model_dump``/``model_validate`` for the slotted dataclass value types.
+
+    The value types below are plain dataclasses for speed, but code written
+    against the former Pydantic models still calls these two methods on them.
+    """
+
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+    def model_dump(
+        self,
+        *,
+        mode: str = "python",
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        exclude_defaults: bool = False,
+        exclude_unset: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Get the fields as a dictionary, like ``BaseModel.model_dump``.
+
+        Args:
+            mode: "python" or "json"; passed on to nested values.
+            include: Field names to keep.
+            exclude: Field names to drop.
+            exclude_defaults: Drop fields equal to their default.
+            exclude_unset: Treated like ``exclude_defaults``, since dataclasses
+                do not record which fields were passed explicitly.
+            **kwargs: Other ``BaseModel.model_dump`` options, accepted for
+                compatibility. These types have no aliases or optional
+                fields, so they do not change the output.
+
+        Returns:
+            Dictionary of field values, with nested values dumped as well.
+        """
+        names: Iterable[str] = self.__dataclass_fields__
+        if include is not None:
+            names = [name for name in names if name in include]
+        if exclude is not None:
+            names = [name for name in names if name not in exclude]
+
+        skip_defaults = exclude_defaults or exclude_unset
+        fields = self.__dataclass_fields__
+        data = {}
+        for name in names:
+            value = getattr(self, name)
+            if skip_defaults and value == fields[name].default:
+                continue
+            if isinstance(value, _DataclassModel):
+                value = value.model_dump(mode=mode, exclude_defaults=skip_defaults)
+            data[name] = value
+        return data
+
+    @classmethod
+    def model_validate(cls: type[_ModelT], obj: Any, **kwargs: Any) -> _ModelT:
+        """Create an instance from a dictionary, like ``BaseModel.model_validate``.
+
+        Keys that are not fields are ignored, as Pydantic does by default.
+
+        Args:
+            obj: An instance of the class, or a dictionary of field values.
+            **kwargs: Other ``BaseModel.model_validate`` options, accepted for
+                compatibility and ignored.
+
+        Returns:
+            ``obj`` itself if it is already an instance, otherwise a new one.
+        """
+        if isinstance(obj, cls):
+            return obj
+        if not isinstance(obj, dict):
+            raise ValidationError.from_exception_data(
+                cls.__name__,
+                [
+                    {
+                        "type": "model_type",
+                        "loc": (),
+                        "input": obj,
+                        "ctx": {"class_name": cls.__name__},
+                    }
+                ],
+            )
+        fields = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in obj.items() if key in fields})
+
+
+# Channel and coefficient constraints, kept as field metadata so that Pydantic
+# enforces them on nested data and reports them in JSON schemas.
+_UnitFloat = Annotated[float, Field(ge=0.0, le=1.0)]
+_NonNegativeFloat = Annotated[float, Field(ge=0.0)]
+
+
+# Vector3 is created in large numbers by spatial code, so it is an immutable
+# slotted dataclass rather than a Pydantic model. Models that embed it still
+# validate and serialize it as {"x": ..., "y": ..., "z": ...}.
+@dataclass(slots=True, frozen=True)
+class Vector3(_DataclassModel):
     """3D vector representation."""
 
     x: float = 0.0
     y: float = 0.0
     z: float = 0.0
 
+    def __post_init__(self) -> None:
+        """Coerce components to float, matching Pydantic's lax mode."""
+        if type(self.x) is not float:
+            object.__setattr__(self, "x", _coerce_float(Vector3, "x", self.x))
+        if type(self.y) is not float:
+            object.__setattr__(self, "y", _coerce_float(Vector3, "y", self.y))
+        if type(self.z) is not float:
+            object.__setattr__(self, "z", _coerce_float(Vector3, "z", self.z))
 
-class Color(BaseModel):
-    """RGBA color representation."""
-
-    r: float = Field(ge=0.0, le=1.0, default=1.0)
-    g: float = Field(ge=0.0, le=1.0, default=1.0)
-    b: float = Field(ge=0.0, le=1.0, default=1.0)
-    a: float = Field(ge=0.0, le=1.0, default=1.0)
 
+@dataclass(slots=True, frozen=True)
+class Color(_DataclassModel):
+    """RGBA color representation."""
 
-class Transform(BaseModel):
+    r: _UnitFloat = 1.0
+    g: _UnitFloat = 1.0
+    b: _UnitFloat = 1.0
+    a: _UnitFloat = 1.0
+
+    def __post_init__(self) -> None:
+        """Coerce channels to float and check they lie in [0, 1]."""
+        for name in ("r", "g", "b", "a"):
+            value = getattr(self, name)
+            if type(value) is not float:
+                value = _coerce_float(Color, name, value)
+                object.__setattr__(self, name, value)
+            if not value >= 0.0:
+                raise _field_error(Color, name, "greater_than_equal", value, {"ge": 0.0})
+            if not value <= 1.0:
+                raise _field_error(Color, name, "less_than_equal", value, {"le": 1.0})
+
+
+# Vector3 and Color are immutable, so fields default to one shared instance
+# rather than building a fresh one per model.
+_ZERO_VECTOR = Vector3()
+_UNIT_SCALE = Vector3(x=1.0, y=1.0, z=1.0)
+_WHITE = Color()
+
+
+@dataclass(slots=True)
+class Transform(_DataclassModel):
     """Spatial transformation for entities."""
 
-    position: Vector3 = Field(default_factory=Vector3)
-    rotation: Vector3 = Field(default_factory=Vector3)
-    scale: Vector3 = Field(default_factory=lambda: Vector3(x=1.0, y=1.0, z=1.0))
+    position: Vector3 = _ZERO_VECTOR
+    rotation: Vector3 = _ZERO_VECTOR
+    scale: Vector3 = _UNIT_SCALE
+
+    def __post_init__(self) -> None:
+        """Accept plain dictionaries for the vectors, as Pydantic would."""
+        if type(self.position) is not Vector3:
+            self.position = Vector3.model_validate(self.position)
+        if type(self.rotation) is not Vector3:
+            self.rotation = Vector3.model_validate(self.rotation)
+        if type(self.scale) is not Vector3:
+            self.scale = Vector3.model_validate(self.scale)
 
 
 class MaterialType(str, Enum):
@@ -52,7 +250,7 @@ class Material(BaseModel):
 
     name: str
     material_type: MaterialType = MaterialType.STANDARD
-    base_color: Color = Field(default_factory=Color)
+    base_color: Color = _WHITE
     metallic: float = Field(ge=0.0, le=1.0, default=0.0)
     roughness: float = Field(ge=0.0, le=1.0, default=0.5)
     emission_color: Color | None = None
@@ -76,7 +274,7 @@ class Lighting(BaseModel):
 
     name: str
     light_type: LightType = LightType.POINT
-    color: Color = Field(default_factory=Color)
+    color: Color = _WHITE
     intensity: float = Field(ge=0.0, default=1.0)
     range: float | None = None
     spot_angle: float | None = None
@@ -101,17 +299,72 @@ class EntityType(str, Enum):
     TERRAIN = "terrain"
 
 
-class PhysicsSettings(BaseModel):
+# Strings accepted as booleans, matching Pydantic's lax bool parsing.
+_BOOL_STRINGS = {
+    "0": False,
+    "off": False,
+    "f": False,
+    "false": False,
+    "n": False,
+    "no": False,
+    "1": True,
+    "on": True,
+    "t": True,
+    "true": True,
+    "y": True,
+    "yes": True,
+}
+
+
+def _coerce_bool(owner: type, name: str, value: Any) -> bool:
+    """Convert a flag value to bool the way a Pydantic ``bool`` field would.
+
+    Args:
+        owner: Class the field belongs to, used in the error.
+        name: Field name, used in the error.
+        value: Bool, 0 or 1, or one of the strings in ``_BOOL_STRINGS``.
+
+    Returns:
+        The parsed boolean.
+    """
+    if isinstance(value, str):
+        parsed = _BOOL_STRINGS.get(value.lower())
+        if parsed is not None:
+            return parsed
+    elif isinstance(value, int | float):
+        if value in (0, 1):
+            return bool(value)
+    else:
+        raise _field_error(owner, name, "bool_type", value)
+    raise _field_error(owner, name, "bool_parsing", value)
+
+
+@dataclass(slots=True)
+class PhysicsSettings(_DataclassModel):
     """Physics configuration for an entity."""
 
     enabled: bool = False
     is_kinematic: bool = False
-    mass: float = Field(ge=0.0, default=1.0)
-    drag: float = Field(ge=0.0, default=0.0)
-    angular_drag: float = Field(ge=0.0, default=0.05)
+    mass: _NonNegativeFloat = 1.0
+    drag: _NonNegativeFloat = 0.0
+    angular_drag: _NonNegativeFloat = 0.05
     use_gravity: bool = True
     collision_enabled: bool = True
 
+    def __post_init__(self) -> None:
+        """Coerce the flags to bool and the coefficients to non-negative floats."""
+        for name in ("enabled", "is_kinematic", "use_gravity", "collision_enabled"):
+            value = getattr(self, name)
+            if type(value) is not bool:
+                setattr(self, name, _coerce_bool(PhysicsSettings, name, value))
+        for name in ("mass", "drag", "angular_drag"):
+            value = getattr(self, name)
+            if type(value) is not float:
+                value = _coerce_float(PhysicsSettings, name, value)
+                setattr(self, name, value)
+            if not value >= 0.0:
+                raise _field_error(PhysicsSettings, name, "greater_than_equal", value, {"ge": 0.0})
+
 
 class ColliderType(str, Enum):
     """Types of collision shapes."""
@@ -128,8 +381,8 @@ class Collider(BaseModel):
 
     collider_type: ColliderType = ColliderType.BOX
     is_trigger: bool = False
-    center: Vector3 = Field(default_factory=Vector3)
-    size: Vector3 = Field(default_factory=lambda: Vector3(x=1.0, y=1.0, z=1.0))
+    center: Vector3 = _ZERO_VECTOR
+    size: Vector3 = _UNIT_SCALE
     radius: float | None = None
     height: float | None = None
 
@@ -137,7 +390,7 @@ class Collider(BaseModel):
 class WDLEntity(BaseModel):
     """Entity definition in the world."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     entity_type: EntityType = EntityType.STATIC_MESH
     transform: Transform = Field(default_factory=Transform)
@@ -177,7 +430,7 @@ class SkyboxSettings(BaseModel):
 
     skybox_type: str = "procedural"
     texture_path: str | None = None
-    tint_color: Color = Field(default_factory=Color)
+    tint_color: Color = _WHITE
     exposure: float = Field(ge=0.0, default=1.0)
     rotation: float = 0.0
 
@@ -187,12 +440,12 @@ class WDLEnvironment(BaseModel):
 
     weather: WeatherType = WeatherType.CLEAR
     time_of_day: TimeOfDay = Field(default_factory=TimeOfDay)
-    ambient_light: Color = Field(default_factory=lambda: Color(r=0.2, g=0.2, b=0.2))
+    ambient_light: Color = Color(r=0.2, g=0.2, b=0.2)
     fog_enabled: bool = False
-    fog_color: Color = Field(default_factory=lambda: Color(r=0.5, g=0.5, b=0.5))
+    fog_color: Color = Color(r=0.5, g=0.5, b=0.5)
     fog_density: float = Field(ge=0.0, le=1.0, default=0.01)
     skybox: SkyboxSettings = Field(default_factory=SkyboxSettings)
-    gravity: Vector3 = Field(default_factory=lambda: Vector3(x=0.0, y=-9.81, z=0.0))
+    gravity: Vector3 = Vector3(x=0.0, y=-9.81, z=0.0)
     audio_reverb_preset: str | None = None
 
 
@@ -233,7 +486,7 @@ class Interaction(BaseModel):
 class WDLSystem(BaseModel):
     """System definition for gameplay logic and mechanics."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     description: str = ""
     interactions: list[Interaction] = Field(default_factory=list)
@@ -245,8 +498,8 @@ class WDLSystem(BaseModel):
 class WorldBounds(BaseModel):
     """World boundary definition."""
 
-    min_bounds: Vector3 = Field(default_factory=lambda: Vector3(x=-1000.0, y=-100.0, z=-1000.0))
-    max_bounds: Vector3 = Field(default_factory=lambda: Vector3(x=1000.0, y=500.0, z=1000.0))
+    min_bounds: Vector3 = Vector3(x=-1000.0, y=-100.0, z=-1000.0)
+    max_bounds: Vector3 = Vector3(x=1000.0, y=500.0, z=1000.0)
 
 
 class WDLMetadata(BaseModel):
@@ -262,11 +515,42 @@ class WDLMetadata(BaseModel):
     target_platforms: list[str] = Field(default_factory=lambda: ["unity", "unreal", "horizon"])
 
 
+@dataclass(slots=True)
+class _EntityIndex:
+    """Id lookup table over a world's entity list, mapping ids to list positions."""
+
+    # The list object the tables were built from, and its length at the time.
+    entities: list[WDLEntity]
+    size: int = 0
+    by_id: dict[str, int] = field(default_factory=dict)
+
+    def extend(self) -> None:
+        """Index the entities appended to the list since the last call.
+
+        Tags are interned in place: the same few tags recur across many
+        entities, and worlds parsed from JSON otherwise hold a separate string
+        object for every occurrence.
+        """
+        by_id = self.by_id
+        entities = self.entities
+        for position in range(self.size, len(entities)):
+            entity = entities[position]
+            by_id.setdefault(entity.id, position)
+            tags = entity.tags
+            if tags:
+                tags[:] = map(sys.intern, tags)
+        self.size = len(entities)
+
+
 class WDLWorld(BaseModel):
     """Root WDL world definition.
 
     This is the main schema for describing a complete 3D world that can be
     translated to various game engines and platforms.
+
+    Bulk spatial queries (boxes, radii, collisions) belong in
+    ``omniworld_builder.tools.spatial_reasoning.SpatialReasoner``, which keeps
+    entity positions in contiguous (N, 3) arrays alongside its spatial indexes.
     """
 
     metadata: WDLMetadata
@@ -276,9 +560,124 @@ class WDLWorld(BaseModel):
     systems: list[WDLSystem] = Field(default_factory=list)
     bounds: WorldBounds = Field(default_factory=WorldBounds)
 
+    # Id lookup table over ``entities``, rebuilt whenever the list object or
+    # its length changes. Derived state, so it is left out of equality.
+    _entity_index: _EntityIndex = PrivateAttr(default_factory=lambda: _EntityIndex([]))
+    # Bumped by every method that changes ``entities``; see ``revision``.
+    _revision: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the entity id index after validation."""
+        self.reindex()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare worlds by their fields, ignoring the id index."""
+        if not isinstance(other, WDLWorld):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever entities are added, removed or reindexed.
+
+        Caches derived from ``entities`` can compare it to tell whether the
+        world changed through its own methods since they were built.
+        """
+        revision: int = self.__pydantic_private__["_revision"]  # type: ignore[index]
+        return revision
+
+    def _bump_revision(self) -> None:
+        """Record a change to ``entities``."""
+        self.__pydantic_private__["_revision"] += 1  # type: ignore[index]
+
+    def _current_index(self) -> _EntityIndex:
+        """Get the id index, rebuilding it if the entity list changed."""
+        # Read the private storage directly; going through BaseModel.__getattr__
+        # costs about 2 us per access, more than the lookup itself.
+        index: _EntityIndex = self.__pydantic_private__["_entity_index"]  # type: ignore[index]
+        if index.entities is not self.entities or index.size != len(self.entities):
+            index = self._build_index()
+        return index
+
+    def _build_index(self) -> _EntityIndex:
+        """Rebuild the id index from scratch."""
+        index = _EntityIndex(self.entities)
+        index.extend()
+        self._entity_index = index
+        return index
+
+    def reindex(self) -> None:
+        """Rebuild the entity id index from ``entities``.
+
+        Lookups never depend on this: appending to, removing from or replacing
+        the list is picked up automatically, and id lookups re-check the entity
+        they find. Calling it bumps ``revision`` so caches such as
+        ``SpatialReasoner`` snapshots are rebuilt after in-place edits.
+        """
+        self._build_index()
+        self._bump_revision()
+
+    def _find_entity(self, entity_id: str) -> int | None:
+        """Get the position of the first entity with an ID, or None."""
+        index = self._current_index()
+        entities = self.entities
+        position = index.by_id.get(entity_id)
+        if position is not None and entities[position].id == entity_id:
+            return position
+
+        # Stale hit or miss: an entity was edited or swapped in place. Fall
+        # back to a scan and resync the index if it was out of date.
+        found = next((i for i, e in enumerate(entities) if e.id == entity_id), None)
+        if found is not None or position is not None:
+            self._build_index()
+        return found
+
     def add_entity(self, entity: WDLEntity) -> None:
         """Add an entity to the world."""
+        index = self._current_index()
         self.entities.append(entity)
+        index.extend()
+        self._bump_revision()
+
+    def extend_entities(self, entities_data: Iterable[dict[str, Any]]) -> int:
+        """Validate and add entities from dictionaries in bulk.
+
+        Each dictionary goes straight to the compiled ``WDLEntity`` validator,
+        which is cheaper than ``WDLEntity(**data)``, ``model_validate`` or even
+        an unvalidated ``model_construct``. If any dictionary fails validation
+        the ValidationError propagates and no entities are added.
+
+        Args:
+            entities_data: Entity dictionaries, e.g. ``model_dump`` output.
+
+        Returns:
+            Number of entities added.
+        """
+        index = self._current_index()
+        validate = WDLEntity.__pydantic_validator__.validate_python
+        entities = [validate(data) for data in entities_data]
+        self.entities.extend(entities)
+        index.extend()
+        self._bump_revision()
+        return len(entities)
+
+    def remove_entity(self, entity_id: str) -> WDLEntity | None:
+        """Remove an entity by its ID.
+
+        Args:
+            entity_id: ID of the entity to remove.
+
+        Returns:
+            The removed entity, or None if no entity has that ID.
+        """
+        position = self._find_entity(entity_id)
+        if position is None:
+            return None
+        entity = self.entities.pop(position)
+        # Later positions shifted down by one.
+        self._build_index()
+        self._bump_revision()
+        return entity
 
     def add_light(self, light: Lighting) -> None:
         """Add a light to the world."""
@@ -290,13 +689,13 @@ class WDLWorld(BaseModel):
 
     def get_entity_by_id(self, entity_id: str) -> WDLEntity | None:
         """Get an entity by its ID."""
-        for entity in self.entities:
-            if entity.id == entity_id:
-                return entity
-        return None
+        position = self._find_entity(entity_id)
+        return self.entities[position] if position is not None else None
 
     def get_entities_by_type(self, entity_type: EntityType) -> list[WDLEntity]:
         """Get all entities of a specific type."""
+        # Types and tags can be edited in place on any entity, so these scan
+        # the live list rather than an index that could silently go stale.
         return [e for e in self.entities if e.entity_type == entity_type]
 
     def get_entities_by_tag(self, tag: str) -> list[WDLEntity]:
@@ -304,10 +703,80 @@ class WDLWorld(BaseModel):
         return [e for e in self.entities if tag in e.tags]
 
     def to_json(self) -> str:
-        """Export the world to JSON format."""
-        return self.model_dump_json(indent=2)
+        """Export the world to compact JSON format."""
+        return self.to_json_bytes().decode()
+
+    def to_json_pretty(self) -> str:
+        """Export the world to indented JSON for people to read."""
+        return self.__pydantic_serializer__.to_json(self, indent=2).decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Export the world to UTF-8 encoded compact JSON.
+
+        Same document as ``to_json``, but taken straight from the compiled
+        serializer so callers that write files or sockets skip the
+        bytes-to-str round trip.
+        """
+        return self.__pydantic_serializer__.to_json(self)
 
     @classmethod
-    def from_json(cls, json_str: str) -> "WDLWorld":
-        """Load a world from JSON format."""
+    def from_json(cls, json_str: str | bytes) -> "WDLWorld":
+        """Load a world from JSON format.
+
+        The whole document, entity lists included, is parsed and validated in
+        one pydantic-core call; splitting the lists out into separate
+        ``TypeAdapter`` passes only adds Python round trips.
+
+        Args:
+            json_str: JSON document as text or UTF-8 encoded bytes.
+
+        Returns:
+            The validated world.
+        """
         return cls.model_validate_json(json_str)
+
+    def write_json(self, path: str | os.PathLike[str], *, indent: int | None = None) -> None:
+        """Write the world to a UTF-8 JSON file.
+
+        Args:
+            path: Destination file path.
+            indent: Indentation for files meant to be read by people. By
+                default the compact ``to_json`` document is written.
+        """
+        Path(path).write_bytes(self.__pydantic_serializer__.to_json(self, indent=indent))
+
+    @classmethod
+    def read_json(cls, path: str | os.PathLike[str]) -> "WDLWorld":
+        """Load a world from a JSON file written by ``write_json`` or ``to_json``.
+
+        Args:
+            path: Source file path.
+
+        Returns:
+            The validated world.
+        """
+        return cls.model_validate_json(Path(path).read_bytes())
+
+    def to_msgpack(self) -> bytes:
+        """Export the world to MessagePack.
+
+        The payload holds the same document as ``to_json`` in a compact
+        binary encoding. Requires the ``msgpack`` extra.
+        """
+        if _msgpack_encoder is None:
+            raise ImportError("to_msgpack requires msgspec (install omniworld-builder[msgpack])")
+        return _msgpack_encoder.encode(self.model_dump(mode="json"))
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "WDLWorld":
+        """Load a world from MessagePack.
+
+        Args:
+            data: Payload produced by ``to_msgpack``.
+
+        Returns:
+            The validated world.
+        """
+        if _msgpack_decoder is None:
+            raise ImportError("from_msgpack requires msgspec (install omniworld-builder[msgpack])")
+        return cls.model_validate(_msgpack_decoder.decode(data))
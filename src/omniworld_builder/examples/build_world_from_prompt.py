@@ -53,10 +53,7 @@ async def main():
         output_path = output_dir / "sky_island_world.json"
 
         print(f"Saving to: {output_path}")
-        json_data = world.to_json()
-
-        with open(output_path, "w") as f:
-            f.write(json_data)
+        world.write_json(output_path, indent=2)
 
         print("✓ World saved successfully!")
         print()
@@ -64,7 +61,7 @@ async def main():
         # Print a preview of the JSON
         print("JSON Preview (first 500 chars):")
         print("-" * 60)
-        print(json_data[:500] + "...")
+        print(output_path.read_text(encoding="utf-8")[:500] + "...")
         print("-" * 60)
         print()
 
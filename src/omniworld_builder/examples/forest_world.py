@@ -226,4 +226,4 @@ def create_forest_world() -> WDLWorld:
 # Create a standalone JSON file when run as script
 if __name__ == "__main__":
     world = create_forest_world()
-    print(world.to_json())
+    print(world.to_json_pretty())
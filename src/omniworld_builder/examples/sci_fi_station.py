@@ -318,4 +318,4 @@ def create_sci_fi_station() -> WDLWorld:
 # Create a standalone JSON file when run as script
 if __name__ == "__main__":
     world = create_sci_fi_station()
-    print(world.to_json())
+    print(world.to_json_pretty())
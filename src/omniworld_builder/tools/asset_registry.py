@@ -1,11 +1,32 @@
 """Asset registry for managing and referencing 3D assets."""
 
+import json
+import math
+import sys
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional extra; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+
+# Maximum number of distinct search queries kept in the registry's LRU cache.
+SEARCH_CACHE_SIZE = 256
+
+# Stamped into exported manifests. Manifests carrying the current version were
+# produced from already-validated assets and are imported without validation.
+MANIFEST_SCHEMA_VERSION = 1
+
 
 class AssetType(str, Enum):
     """Types of assets that can be registered."""
@@ -21,8 +42,14 @@ class AssetType(str, Enum):
     SCRIPT = "script"
 
 
-class AssetPlatformInfo(BaseModel):
-    """Platform-specific asset information."""
+@dataclass(slots=True, frozen=True)
+class AssetPlatformInfo:
+    """Platform-specific asset information.
+
+    A plain slotted dataclass rather than a Pydantic model, since assets can
+    carry one per platform. Pydantic still validates and serializes it as a
+    field of :class:`Asset`.
+    """
 
     path: str
     format: str
@@ -45,15 +72,148 @@ class Asset(BaseModel):
 
     def get_platform_path(self, platform: str) -> str | None:
         """Get the asset path for a specific platform."""
-        if platform in self.platform_info:
-            return self.platform_info[platform].path
-        return self.source_path
+        info = self.platform_info.get(platform)
+        return info.path if info is not None else self.source_path
 
     def has_platform_support(self, platform: str) -> bool:
         """Check if the asset supports a specific platform."""
         return platform in self.platform_info
 
 
+# Value-to-member map for the trusted construct path. A dict lookup is roughly
+# ten times cheaper than calling the Enum class, and because AssetType is a str
+# enum its members also hash to their values.
+_ASSET_TYPES = {member.value: member for member in AssetType}
+
+
+def _construct_asset(data: dict[str, Any]) -> Asset:
+    """Build an Asset from trusted data without running validators.
+
+    Nested values that ``model_construct`` would leave as raw JSON (the enum
+    and the platform info entries) are converted explicitly. The fields the
+    registry itself reads when indexing and searching are still checked, so
+    a malformed entry raises ``ValueError`` here, like it would under
+    validation, instead of failing later inside a search.
+    """
+    fields = dict(data)
+    for name in ("id", "name"):
+        if not isinstance(fields.get(name), str):
+            raise ValueError(f"Asset field '{name}' must be a string")
+    if not isinstance(fields.get("description", ""), str):
+        raise ValueError("Asset field 'description' must be a string")
+    for name in ("source_path", "thumbnail_path"):
+        if not isinstance(fields.get(name), str | None):
+            raise ValueError(f"Asset field '{name}' must be a string or null")
+    tags = fields.get("tags", [])
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise ValueError("Asset field 'tags' must be a list of strings")
+    if not isinstance(fields.get("metadata", {}), dict):
+        raise ValueError("Asset field 'metadata' must be an object")
+    platform_info = fields.get("platform_info", {})
+    if not isinstance(platform_info, dict):
+        raise ValueError("Asset field 'platform_info' must be an object")
+
+    asset_type = _ASSET_TYPES.get(fields.get("asset_type", ""))
+    if asset_type is None:
+        raise ValueError("Asset field 'asset_type' must be a known asset type")
+    fields["asset_type"] = asset_type
+    fields["platform_info"] = {}
+    for platform, info in platform_info.items():
+        fields["platform_info"][platform] = _construct_platform_info(platform, info)
+    return Asset.model_construct(**fields)
+
+
+# Field names accepted by AssetPlatformInfo; other keys in trusted platform
+# entries are dropped, as validation would ignore them.
+_PLATFORM_INFO_FIELDS = frozenset(AssetPlatformInfo.__dataclass_fields__)
+
+
+def _construct_platform_info(platform: Any, info: Any) -> AssetPlatformInfo:
+    """Build one platform entry of a trusted asset, checking its field types."""
+    if not (isinstance(platform, str) and isinstance(info, dict)):
+        raise ValueError(f"Platform info for '{platform}' must be an object")
+    info = {key: value for key, value in info.items() if key in _PLATFORM_INFO_FIELDS}
+    for name in ("path", "format"):
+        if not isinstance(info.get(name), str):
+            raise ValueError(f"Platform info for '{platform}' needs a string {name}")
+    if not isinstance(info.get("optimized", False), bool):
+        raise ValueError(f"Platform info for '{platform}' needs a boolean 'optimized'")
+    lod_levels = info.get("lod_levels", 1)
+    if not isinstance(lod_levels, int) or isinstance(lod_levels, bool):
+        raise ValueError(f"Platform info for '{platform}' needs an integer 'lod_levels'")
+    return AssetPlatformInfo(**info)
+
+
+def _intern_asset_strings(asset: Asset) -> None:
+    """Intern an asset's frequently repeated strings in place.
+
+    Tags, platform keys, formats and source paths recur across many assets;
+    interning them shares one string object per value and lets index
+    lookups short-circuit on identity.
+
+    Containers are updated in place and the source path is swapped for an
+    equal string without going through ``__setattr__``, so the caller's
+    objects and the asset's ``model_fields_set`` are left as they were.
+    """
+    asset.tags[:] = [sys.intern(tag) for tag in asset.tags]
+    if asset.source_path is not None:
+        asset.__dict__["source_path"] = sys.intern(asset.source_path)
+    if asset.platform_info:
+        interned = {
+            sys.intern(platform): replace(info, format=sys.intern(info.format))
+            for platform, info in asset.platform_info.items()
+        }
+        asset.platform_info.clear()
+        asset.platform_info.update(interned)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib encoder does not handle, as orjson does.
+
+    Covers NumPy arrays and scalars, enums, and ``datetime``, ``date`` and
+    ``time`` values, which orjson writes as ISO 8601 strings.
+    """
+    if hasattr(value, "tolist"):
+        return _json_compatible(value.tolist())
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_key(key: Any) -> Any:
+    """Convert a non-string mapping key the way ``orjson.OPT_NON_STR_KEYS`` does."""
+    if key is None or isinstance(key, str | int | float):
+        # The stdlib encoder already writes these as "null", "true", "1"...
+        return key
+    return _json_default(key)
+
+
+def _json_compatible(value: Any) -> Any:
+    """Prepare asset data for the stdlib encoder so it matches orjson's output.
+
+    orjson writes NaN and infinities as ``null`` and stringifies non-string
+    keys, where the stdlib encoder would write bare ``NaN`` or raise.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {_json_key(key): _json_compatible(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_json_compatible(item) for item in value]
+    return value
+
+
+def _discard_from_index(index: dict[Any, dict[str, None]], key: Any, asset_id: str) -> None:
+    """Remove an asset ID from an index bucket, deleting the bucket once empty."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(asset_id, None)
+        if not bucket:
+            del index[key]
+
+
 class AssetRegistry:
     """Registry for managing and querying 3D assets.
 
@@ -65,27 +225,76 @@ class AssetRegistry:
     def __init__(self) -> None:
         """Initialize the asset registry."""
         self._assets: dict[str, Asset] = {}
-        self._tags_index: dict[str, set[str]] = {}
-        self._type_index: dict[AssetType, set[str]] = {}
+        # Indexes map keys to insertion-ordered dicts of asset IDs, used as
+        # ordered sets so indexed lookups keep registration order.
+        self._tags_index: dict[str, dict[str, None]] = {}
+        self._type_index: dict[AssetType, dict[str, None]] = {}
+        self._platform_index: dict[str, dict[str, None]] = {}
+        # Bumped on every mutation. Search cache keys embed the version, so
+        # stale entries stop matching and age out of the LRU on their own.
+        self._version = 0
+        self._search_cache: OrderedDict[tuple, list[Asset]] = OrderedDict()
+        # Lowercased names and descriptions of all assets joined into one
+        # string, with the start offset and ID of each asset; rebuilt lazily.
+        self._text_corpus: tuple[str, list[int], list[str]] | None = None
 
     def register(self, asset: Asset) -> None:
         """Register a new asset.
 
+        Re-registering an existing ID replaces the previous asset.
+
         Args:
             asset: The asset to register.
         """
-        self._assets[asset.id] = asset
+        self.register_many((asset,))
 
-        # Index by tags
-        for tag in asset.tags:
-            if tag not in self._tags_index:
-                self._tags_index[tag] = set()
-            self._tags_index[tag].add(asset.id)
+    def register_many(self, assets: Iterable[Asset]) -> int:
+        """Register several assets at once.
+
+        Equivalent to calling :meth:`register` for each asset, but derived
+        caches are invalidated once for the whole batch, which keeps bulk
+        imports cheap.
+
+        Args:
+            assets: The assets to register, in order.
 
-        # Index by type
-        if asset.asset_type not in self._type_index:
-            self._type_index[asset.asset_type] = set()
-        self._type_index[asset.asset_type].add(asset.id)
+        Returns:
+            Number of assets registered.
+        """
+        interned = []
+        for asset in assets:
+            _intern_asset_strings(asset)
+            interned.append(asset)
+        return self._add_assets(interned)
+
+    def _add_assets(self, assets: list[Asset]) -> int:
+        """Store and index assets whose strings are already interned."""
+        self._version += 1
+        self._text_corpus = None
+        count = 0
+        for asset in assets:
+            if asset.id in self._assets:
+                self.unregister(asset.id)
+            self._assets[asset.id] = asset
+
+            # Index by tags
+            for tag in asset.tags:
+                if tag not in self._tags_index:
+                    self._tags_index[tag] = {}
+                self._tags_index[tag][asset.id] = None
+
+            # Index by type
+            if asset.asset_type not in self._type_index:
+                self._type_index[asset.asset_type] = {}
+            self._type_index[asset.asset_type][asset.id] = None
+
+            # Index by supported platform
+            for platform in asset.platform_info:
+                if platform not in self._platform_index:
+                    self._platform_index[platform] = {}
+                self._platform_index[platform][asset.id] = None
+            count += 1
+        return count
 
     def unregister(self, asset_id: str) -> bool:
         """Unregister an asset.
@@ -99,16 +308,17 @@ class AssetRegistry:
         if asset_id not in self._assets:
             return False
 
+        self._version += 1
+        self._text_corpus = None
         asset = self._assets[asset_id]
 
-        # Remove from tag index
+        # Remove from the indexes, dropping buckets that become empty so that
+        # index keys always reflect the registered assets.
         for tag in asset.tags:
-            if tag in self._tags_index:
-                self._tags_index[tag].discard(asset_id)
-
-        # Remove from type index
-        if asset.asset_type in self._type_index:
-            self._type_index[asset.asset_type].discard(asset_id)
+            _discard_from_index(self._tags_index, tag, asset_id)
+        _discard_from_index(self._type_index, asset.asset_type, asset_id)
+        for platform in asset.platform_info:
+            _discard_from_index(self._platform_index, platform, asset_id)
 
         del self._assets[asset_id]
         return True
@@ -144,9 +354,7 @@ class AssetRegistry:
         Returns:
             List of assets with the tag.
         """
-        if tag not in self._tags_index:
-            return []
-        return [self._assets[aid] for aid in self._tags_index[tag] if aid in self._assets]
+        return [self._assets[aid] for aid in self._tags_index.get(tag, ())]
 
     def get_by_type(self, asset_type: AssetType) -> list[Asset]:
         """Get all assets of a specific type.
@@ -157,9 +365,7 @@ class AssetRegistry:
         Returns:
             List of assets of the specified type.
         """
-        if asset_type not in self._type_index:
-            return []
-        return [self._assets[aid] for aid in self._type_index[asset_type] if aid in self._assets]
+        return [self._assets[aid] for aid in self._type_index.get(asset_type, ())]
 
     def search(
         self,
@@ -179,26 +385,99 @@ class AssetRegistry:
         Returns:
             List of matching assets.
         """
-        results = list(self._assets.values())
-
+        key = (
+            self._version,
+            query.lower() if query else None,
+            asset_type or None,
+            frozenset(tags or ()),
+            platform or None,
+        )
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            return list(cached)
+
+        results = self._search_uncached(query, asset_type, tags, platform)
+        self._search_cache[key] = results
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
+
+    def _search_uncached(
+        self,
+        query: str | None,
+        asset_type: AssetType | None,
+        tags: list[str] | None,
+        platform: str | None,
+    ) -> list[Asset]:
+        """Run a search against the registry without consulting the cache."""
+        # Start from the smallest matching index bucket and intersect the rest,
+        # so every filter costs O(matches) instead of a full registry scan.
+        buckets: list[dict[str, None]] = []
+        if asset_type:
+            buckets.append(self._type_index.get(asset_type, {}))
+        if tags:
+            buckets.extend(self._tags_index.get(t, {}) for t in tags)
+        if platform:
+            buckets.append(self._platform_index.get(platform, {}))
         if query:
-            query_lower = query.lower()
+            buckets.append(self._match_text(query.lower()))
+
+        if buckets:
+            buckets.sort(key=len)
+            smallest, rest = buckets[0], buckets[1:]
             results = [
-                a
-                for a in results
-                if query_lower in a.name.lower() or query_lower in a.description.lower()
+                self._assets[aid] for aid in smallest if all(aid in bucket for bucket in rest)
             ]
+        else:
+            results = list(self._assets.values())
 
-        if asset_type:
-            results = [a for a in results if a.asset_type == asset_type]
+        return results
 
-        if tags:
-            results = [a for a in results if all(t in a.tags for t in tags)]
+    def _match_text(self, query_lower: str) -> dict[str, None]:
+        """Find the IDs of assets whose name or description contains a query.
 
-        if platform:
-            results = [a for a in results if a.has_platform_support(platform)]
+        Rather than lowercasing and scanning every asset in Python, all names
+        and descriptions are searched in one pass over a single NUL-separated
+        corpus string; each hit is mapped back to its asset by offset.
 
-        return results
+        Args:
+            query_lower: The lowercased substring to look for.
+
+        Returns:
+            Matching asset IDs, as an ordered set in registration order.
+        """
+        if "\0" in query_lower:
+            # The separator itself is searched for; match each asset directly.
+            return {
+                a.id: None
+                for a in self._assets.values()
+                if query_lower in a.name.lower() or query_lower in a.description.lower()
+            }
+
+        if self._text_corpus is None:
+            parts: list[str] = []
+            starts: list[int] = []
+            position = 0
+            for asset in self._assets.values():
+                text = f"{asset.name.lower()}\0{asset.description.lower()}\0"
+                starts.append(position)
+                parts.append(text)
+                position += len(text)
+            self._text_corpus = ("".join(parts), starts, list(self._assets))
+        corpus, starts, ids = self._text_corpus
+
+        matches: dict[str, None] = {}
+        find = corpus.find
+        hit = find(query_lower)
+        while hit != -1:
+            index = bisect_right(starts, hit) - 1
+            matches[ids[index]] = None
+            # Skip the rest of this asset's text; it already matched.
+            if index + 1 == len(starts):
+                break
+            hit = find(query_lower, starts[index + 1])
+        return matches
 
     def list_all(self) -> list[Asset]:
         """List all registered assets.
@@ -231,31 +510,47 @@ class AssetRegistry:
             Dictionary representation of all assets.
         """
         return {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
             "assets": [a.model_dump() for a in self._assets.values()],
             "total_count": len(self._assets),
             "tags": self.get_all_tags(),
             "types": [t.value for t in self._type_index.keys()],
         }
 
-    def import_manifest(self, manifest: dict[str, Any]) -> int:
+    def import_manifest(self, manifest: dict[str, Any], *, validate: bool | None = None) -> int:
         """Import assets from a manifest dictionary.
 
         Args:
             manifest: Dictionary containing asset data.
+            validate: Run full Pydantic validation on each asset. By default,
+                manifests stamped with the current ``schema_version`` by
+                :meth:`export_manifest` skip validation and all others are
+                validated.
 
         Returns:
             Number of assets imported.
         """
-        count = 0
+        if validate is None:
+            validate = manifest.get("schema_version") != MANIFEST_SCHEMA_VERSION
+        build = Asset.model_validate if validate else _construct_asset
+        assets = []
         for asset_data in manifest.get("assets", []):
             try:
-                asset = Asset.model_validate(asset_data)
-                self.register(asset)
-                count += 1
+                asset = build(asset_data)
             except (ValueError, TypeError, KeyError):
-                # Skip invalid asset data but continue importing others
-                continue
-        return count
+                if validate:
+                    # Skip invalid asset data but continue importing others
+                    continue
+                # A trusted entry that fails the fast checks gets a full
+                # validation pass, which may still coerce it, before being
+                # skipped.
+                try:
+                    asset = Asset.model_validate(asset_data)
+                except ValueError:
+                    continue
+            _intern_asset_strings(asset)
+            assets.append(asset)
+        return self._add_assets(assets)
 
     def save(self, path: str | Path) -> None:
         """Save the registry to a JSON file.
@@ -263,28 +558,37 @@ class AssetRegistry:
         Args:
             path: Path to save the registry.
         """
-        import json
-
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.export_manifest(), f, indent=2)
-
-    def load(self, path: str | Path) -> int:
+        manifest = self.export_manifest()
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            path.write_bytes(orjson.dumps(manifest, option=option))
+        else:
+            manifest = _json_compatible(manifest)
+            text = json.dumps(manifest, indent=2, ensure_ascii=False, default=_json_default)
+            path.write_bytes(text.encode())
+
+    def load(self, path: str | Path, validate: bool | None = None) -> int:
         """Load the registry from a JSON file.
 
+        Files written by :meth:`save` are trusted by default and loaded
+        without re-running Pydantic validation.
+
         Args:
             path: Path to load the registry from.
+            validate: Run full Pydantic validation on each asset. Defaults
+                to validating only files without the current schema version.
 
         Returns:
             Number of assets loaded.
         """
-        import json
-
         path = Path(path)
         if not path.exists():
             return 0
 
-        with open(path) as f:
-            manifest = json.load(f)
-        return self.import_manifest(manifest)
+        if orjson is not None:
+            manifest = orjson.loads(path.read_bytes())
+        else:
+            manifest = json.loads(path.read_bytes())
+        return self.import_manifest(manifest, validate=validate)
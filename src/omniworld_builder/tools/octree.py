@@ -0,0 +1,168 @@
+"""Pointerless linear octree for axis-aligned queries over entity positions."""
+
+import numpy as np
+
+# Number of bits per axis in a Morton code; also the maximum octree depth.
+MORTON_BITS = 10
+
+_NODE_DTYPE = np.dtype(
+    [
+        ("first_child", np.uint32),
+        ("child_count", np.uint32),
+        ("start", np.int32),
+        ("end", np.int32),
+        ("min", np.float64, (3,)),
+        ("max", np.float64, (3,)),
+    ]
+)
+
+
+def morton_codes(points: np.ndarray) -> np.ndarray:
+    """Compute 30-bit Morton codes for points normalized to their bounding box.
+
+    Args:
+        points: Array of points with shape (N, 3).
+
+    Returns:
+        Array of N uint32 codes interleaving 10 bits per axis.
+    """
+    lo = points.min(axis=0)
+    extent = points.max(axis=0) - lo
+    extent[extent == 0] = 1.0
+    grid = ((points - lo) / extent * ((1 << MORTON_BITS) - 1)).astype(np.uint32)
+
+    # Spread the low 10 bits of each coordinate so they interleave.
+    grid = (grid * np.uint32(0x00010001)) & np.uint32(0xFF0000FF)
+    grid = (grid * np.uint32(0x00000101)) & np.uint32(0x0F00F00F)
+    grid = (grid * np.uint32(0x00000011)) & np.uint32(0xC30C30C3)
+    grid = (grid * np.uint32(0x00000005)) & np.uint32(0x49249249)
+    codes: np.ndarray = (grid[:, 0] << np.uint32(2)) | (grid[:, 1] << np.uint32(1)) | grid[:, 2]
+    return codes
+
+
+class LinearOctree:
+    """Octree over a fixed set of points, stored as flat arrays.
+
+    Points are sorted by Morton code so that every octree node covers a
+    contiguous slice of the sorted order. Nodes live in a single NumPy
+    structured array: each node stores the index of its first child (children
+    are contiguous), the slice of sorted points it covers, and the tight
+    bounds of those points. There are no per-node Python objects, which keeps
+    traversal cache-friendly and construction cheap.
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 16) -> None:
+        """Build the octree.
+
+        Args:
+            points: Array of points with shape (N, 3).
+            leaf_size: Maximum number of points in a leaf before it is split.
+        """
+        self.points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        self.leaf_size = leaf_size
+
+        count = len(self.points)
+        if count:
+            codes = morton_codes(self.points)
+            self.order = np.argsort(codes, kind="stable")
+            self._codes = codes[self.order]
+        else:
+            self.order = np.empty(0, dtype=np.intp)
+            self._codes = np.empty(0, dtype=np.uint32)
+        self._sorted_points = self.points[self.order]
+        self.nodes = self._build()
+
+    def __len__(self) -> int:
+        """Get the number of points in the octree."""
+        return len(self.points)
+
+    def _build(self) -> np.ndarray:
+        """Build the node array breadth-first from the sorted Morton codes."""
+        if not len(self.points):
+            return np.empty(0, dtype=_NODE_DTYPE)
+
+        # (start, end, depth) per node; children of a node are appended together.
+        ranges: list[tuple[int, int, int]] = [(0, len(self.points), 0)]
+        links: list[tuple[int, int]] = []
+        i = 0
+        while i < len(ranges):
+            start, end, depth = ranges[i]
+            if end - start <= self.leaf_size or depth == MORTON_BITS:
+                links.append((0, 0))
+            else:
+                shift = np.uint32(3 * (MORTON_BITS - depth - 1))
+                octants = (self._codes[start:end] >> shift) & np.uint32(7)
+                bounds = np.searchsorted(octants, np.arange(9, dtype=np.uint32)) + start
+                first = len(ranges)
+                for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                    if hi > lo:
+                        ranges.append((lo, hi, depth + 1))
+                links.append((first, len(ranges) - first))
+            i += 1
+
+        nodes = np.empty(len(ranges), dtype=_NODE_DTYPE)
+        nodes["first_child"] = [link[0] for link in links]
+        nodes["child_count"] = [link[1] for link in links]
+        nodes["start"] = [r[0] for r in ranges]
+        nodes["end"] = [r[1] for r in ranges]
+        for index, (start, end, _) in enumerate(ranges):
+            chunk = self._sorted_points[start:end]
+            nodes["min"][index] = chunk.min(axis=0)
+            nodes["max"][index] = chunk.max(axis=0)
+        return nodes
+
+    def query_box(self, box_min: np.ndarray, box_max: np.ndarray) -> np.ndarray:
+        """Find all points inside an axis-aligned box (inclusive).
+
+        Args:
+            box_min: Minimum corner of the box.
+            box_max: Maximum corner of the box.
+
+        Returns:
+            Sorted array of indices into the original points.
+        """
+        if not len(self.nodes):
+            return np.empty(0, dtype=np.intp)
+
+        lo = np.asarray(box_min, dtype=np.float64)
+        hi = np.asarray(box_max, dtype=np.float64)
+        nodes = self.nodes
+        hits: list[np.ndarray] = []
+        stack = [0]
+        while stack:
+            node = nodes[stack.pop()]
+            node_min = node["min"]
+            node_max = node["max"]
+            if (node_min > hi).any() or (node_max < lo).any():
+                continue
+
+            start, end = int(node["start"]), int(node["end"])
+            if (node_min >= lo).all() and (node_max <= hi).all():
+                hits.append(self.order[start:end])
+            elif node["child_count"] == 0:
+                points = self._sorted_points[start:end]
+                mask = ((lo <= points) & (points <= hi)).all(axis=1)
+                hits.append(self.order[start:end][mask])
+            else:
+                first = int(node["first_child"])
+                stack.extend(range(first, first + int(node["child_count"])))
+
+        if not hits:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(hits))
+
+    def query_radius(self, center: np.ndarray, radius: float) -> np.ndarray:
+        """Find all points within a radius of a center point (inclusive).
+
+        Args:
+            center: The center point.
+            radius: The search radius.
+
+        Returns:
+            Sorted array of indices into the original points.
+        """
+        center = np.asarray(center, dtype=np.float64)
+        candidates = self.query_box(center - radius, center + radius)
+        diff = self.points[candidates] - center
+        hits: np.ndarray = candidates[(diff * diff).sum(axis=1) <= radius * radius]
+        return hits
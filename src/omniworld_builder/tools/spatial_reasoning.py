@@ -1,42 +1,125 @@
 """Spatial reasoning utilities for world layout and entity placement."""
 
 import math
-from dataclasses import dataclass
+import operator
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
 from typing import Any
 
-from omniworld_builder.core.wdl_schema import Vector3, WDLEntity, WDLWorld
-
+import numpy as np
 
-@dataclass
+from omniworld_builder.core.wdl_schema import Vector3, WDLEntity, WDLWorld
+from omniworld_builder.tools.octree import LinearOctree, morton_codes
+
+try:
+    import scipy.spatial
+except ImportError:  # scipy is an optional extra; fall back to NumPy scans
+    scipy = None
+
+try:
+    import numba
+except ImportError:  # numba is an optional extra; fall back to NumPy kernels
+    numba = None  # type: ignore[assignment]
+
+# Below this many entities a linear collision scan beats building a BVH.
+BVH_MIN_ENTITIES = 16
+
+# From this many entities on, box queries (and radius queries without scipy)
+# go through a linear octree instead of a full scan. The vectorized scan wins
+# below roughly 50k entities, and the octree only pays off for selective
+# queries: at 100k it answers a small box in ~0.8 ms against ~2.7 ms for the
+# scan, after a ~200 ms build, while boxes covering a large share of the world
+# are still faster to scan.
+OCTREE_MIN_ENTITIES = 100_000
+
+# From this many candidate pairs on, collision overlap tests run in the
+# parallel numba kernel. Below it the NumPy check takes under a millisecond,
+# while the first kernel call costs 0.15 s (cached) to 0.7 s (cold compile).
+NUMBA_MIN_CANDIDATE_PAIRS = 10_000
+
+# Number of placement rings whose candidates are tested in one batch.
+_PLACEMENT_RING_BATCH = 64
+
+# Unit (x, z) directions tried on each placement ring, every 30 degrees.
+_PLACEMENT_DIRECTIONS = np.array(
+    [(math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 30)]
+)
+
+_BVH_LEAF = np.uint32(0xFFFFFFFF)
+
+# Array-backed BVH node. Leaves store the entity index in ``left`` and
+# ``_BVH_LEAF`` in ``right``; internal nodes store their two child node indices.
+_BVH_NODE_DTYPE = np.dtype(
+    [
+        ("left", np.uint32),
+        ("right", np.uint32),
+        ("min", np.float64, (3,)),
+        ("max", np.float64, (3,)),
+    ]
+)
+
+
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
-    """Axis-aligned bounding box for spatial calculations."""
+    """Axis-aligned bounding box for spatial calculations.
+
+    Bounding boxes are immutable, so derived values such as the center,
+    size and volume are computed once on first access.
+    """
 
     min_point: Vector3
     max_point: Vector3
+    # Slotted classes cannot use cached_property, so derived values are
+    # cached in dedicated slots instead.
+    _center: Vector3 | None = field(default=None, init=False, repr=False, compare=False)
+    _size: Vector3 | None = field(default=None, init=False, repr=False, compare=False)
+    _volume: float | None = field(default=None, init=False, repr=False, compare=False)
+
+    def with_bounds(
+        self, min_point: Vector3 | None = None, max_point: Vector3 | None = None
+    ) -> "BoundingBox":
+        """Create a copy of this bounding box with different corners."""
+        return replace(
+            self,
+            min_point=self.min_point if min_point is None else min_point,
+            max_point=self.max_point if max_point is None else max_point,
+        )
 
     @property
     def center(self) -> Vector3:
         """Get the center point of the bounding box."""
-        return Vector3(
-            x=(self.min_point.x + self.max_point.x) / 2,
-            y=(self.min_point.y + self.max_point.y) / 2,
-            z=(self.min_point.z + self.max_point.z) / 2,
-        )
+        center = self._center
+        if center is None:
+            center = Vector3(
+                x=(self.min_point.x + self.max_point.x) / 2,
+                y=(self.min_point.y + self.max_point.y) / 2,
+                z=(self.min_point.z + self.max_point.z) / 2,
+            )
+            object.__setattr__(self, "_center", center)
+        return center
 
     @property
     def size(self) -> Vector3:
         """Get the size of the bounding box."""
-        return Vector3(
-            x=self.max_point.x - self.min_point.x,
-            y=self.max_point.y - self.min_point.y,
-            z=self.max_point.z - self.min_point.z,
-        )
+        size = self._size
+        if size is None:
+            size = Vector3(
+                x=self.max_point.x - self.min_point.x,
+                y=self.max_point.y - self.min_point.y,
+                z=self.max_point.z - self.min_point.z,
+            )
+            object.__setattr__(self, "_size", size)
+        return size
 
     @property
     def volume(self) -> float:
         """Get the volume of the bounding box."""
-        size = self.size
-        return size.x * size.y * size.z
+        volume = self._volume
+        if volume is None:
+            size = self.size
+            volume = size.x * size.y * size.z
+            object.__setattr__(self, "_volume", volume)
+        return volume
 
     def contains_point(self, point: Vector3) -> bool:
         """Check if a point is inside the bounding box."""
@@ -57,6 +140,52 @@ class BoundingBox:
             and self.max_point.z >= other.min_point.z
         )
 
+    def as_array(self) -> np.ndarray:
+        """Pack the bounds as ``[min.x, min.y, min.z, max.x, max.y, max.z]``."""
+        return np.array(
+            [
+                self.min_point.x,
+                self.min_point.y,
+                self.min_point.z,
+                self.max_point.x,
+                self.max_point.y,
+                self.max_point.z,
+            ],
+            dtype=np.float64,
+        )
+
+    def contains_point_batch(self, points: np.ndarray) -> np.ndarray:
+        """Check which of many points are inside the bounding box.
+
+        Args:
+            points: Array of points with shape (N, 3).
+
+        Returns:
+            Boolean mask of shape (N,).
+        """
+        bounds = self.as_array()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        mask: np.ndarray = np.all((bounds[:3] <= points) & (points <= bounds[3:]), axis=1)
+        return mask
+
+    def intersects_batch(self, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """Check which of many boxes intersect this bounding box.
+
+        Args:
+            mins: Minimum corners of the other boxes, shape (N, 3).
+            maxs: Maximum corners of the other boxes, shape (N, 3).
+
+        Returns:
+            Boolean mask of shape (N,).
+        """
+        bounds = self.as_array()
+        mins = np.asarray(mins, dtype=np.float64).reshape(-1, 3)
+        maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 3)
+        mask: np.ndarray = ~(
+            np.any(bounds[3:] < mins, axis=1) | np.any(bounds[:3] > maxs, axis=1)
+        )
+        return mask
+
     def expand(self, amount: float) -> "BoundingBox":
         """Create an expanded bounding box."""
         return BoundingBox(
@@ -73,27 +202,159 @@ class BoundingBox:
         )
 
 
-def distance(p1: Vector3, p2: Vector3) -> float:
-    """Calculate Euclidean distance between two points."""
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-    dz = p2.z - p1.z
-    return math.sqrt(dx * dx + dy * dy + dz * dz)
+def distance(p1: Vector3 | np.ndarray, p2: Vector3 | np.ndarray) -> float | np.ndarray:
+    """Calculate Euclidean distance between two points.
+
+    NumPy arrays are delegated to :func:`distance_batch`.
+    """
+    if isinstance(p1, np.ndarray) or isinstance(p2, np.ndarray):
+        return distance_batch(np.asarray(p1), np.asarray(p2))
+    # math.hypot does the squaring, summing and sqrt in a single C call.
+    return math.hypot(p2.x - p1.x, p2.y - p1.y, p2.z - p1.z)
+
 
+def distance_squared(
+    p1: Vector3 | np.ndarray, p2: Vector3 | np.ndarray
+) -> float | np.ndarray:
+    """Calculate squared Euclidean distance (faster, no sqrt).
 
-def distance_squared(p1: Vector3, p2: Vector3) -> float:
-    """Calculate squared Euclidean distance (faster, no sqrt)."""
+    NumPy arrays are delegated to :func:`distance_squared_batch`.
+    """
+    if isinstance(p1, np.ndarray) or isinstance(p2, np.ndarray):
+        return distance_squared_batch(np.asarray(p1), np.asarray(p2))
     dx = p2.x - p1.x
     dy = p2.y - p1.y
     dz = p2.z - p1.z
     return dx * dx + dy * dy + dz * dz
 
 
+if numba is not None:
+    # Kernels compile lazily on first call (and are cached on disk), so
+    # importing this module does not pay for numba compilation.
+
+    @numba.njit(cache=True)
+    def _squared_euclidean_nb(x: np.ndarray, y: np.ndarray) -> float:
+        """Squared Euclidean distance between two contiguous float64 vectors."""
+        result = 0.0
+        for dim in range(x.shape[0]):
+            diff = x[dim] - y[dim]
+            result += diff * diff
+        return result
+
+    @numba.njit(cache=True)
+    def _squared_euclidean_rows_nb(query: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Squared Euclidean distance from one vector to every row of an array."""
+        out = np.empty(points.shape[0], dtype=np.float64)
+        for i in range(points.shape[0]):
+            out[i] = _squared_euclidean_nb(query, points[i])
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def _overlapping_pairs_nb(
+        aabb_min: np.ndarray, aabb_max: np.ndarray, candidate_pairs: np.ndarray
+    ) -> np.ndarray:
+        """Flag candidate pairs whose AABBs overlap, in parallel over pairs."""
+        out = np.empty(candidate_pairs.shape[0], dtype=np.bool_)
+        for k in numba.prange(candidate_pairs.shape[0]):
+            i = candidate_pairs[k, 0]
+            j = candidate_pairs[k, 1]
+            # Bitwise ands keep the six comparisons free of branches.
+            out[k] = (
+                (aabb_min[i, 0] <= aabb_max[j, 0])
+                & (aabb_max[i, 0] >= aabb_min[j, 0])
+                & (aabb_min[i, 1] <= aabb_max[j, 1])
+                & (aabb_max[i, 1] >= aabb_min[j, 1])
+                & (aabb_min[i, 2] <= aabb_max[j, 2])
+                & (aabb_max[i, 2] >= aabb_min[j, 2])
+            )
+        return out
+
+else:
+    _squared_euclidean_nb = None
+    _squared_euclidean_rows_nb = None
+    _overlapping_pairs_nb = None
+
+
+def distance_squared_batch(points_a: np.ndarray, points_b: np.ndarray) -> np.ndarray:
+    """Calculate squared Euclidean distances between arrays of points.
+
+    Uses the JIT-compiled kernels when numba is installed and one side is a
+    single point.
+
+    Args:
+        points_a: A single point of shape (3,) or points of shape (N, 3).
+        points_b: A single point of shape (3,) or points of shape (N, 3).
+
+    Returns:
+        Squared distances, broadcast over the leading dimension.
+    """
+    a = np.ascontiguousarray(points_a, dtype=np.float64)
+    b = np.ascontiguousarray(points_b, dtype=np.float64)
+    squared: np.ndarray
+    if _squared_euclidean_nb is not None and a.ndim == 1:
+        if b.ndim == 1 and a.shape == b.shape:
+            squared = np.float64(_squared_euclidean_nb(a, b))
+            return squared
+        if b.ndim == 2 and b.shape[1] == a.shape[0]:
+            squared = _squared_euclidean_rows_nb(a, b)
+            return squared
+    diff = b - a
+    squared = (diff * diff).sum(axis=-1)
+    return squared
+
+
+def distance_squared_arr(positions: np.ndarray, point: Vector3) -> np.ndarray:
+    """Calculate squared distances from every row of an array to one point.
+
+    Args:
+        positions: Points of shape (N, 3).
+        point: The reference point.
+
+    Returns:
+        Squared distances of shape (N,).
+    """
+    return distance_squared_batch(np.array((point.x, point.y, point.z)), positions)
+
+
+def distance_batch(points_a: np.ndarray, points_b: np.ndarray) -> np.ndarray:
+    """Calculate Euclidean distances between arrays of points.
+
+    Args:
+        points_a: A single point of shape (3,) or points of shape (N, 3).
+        points_b: A single point of shape (3,) or points of shape (N, 3).
+
+    Returns:
+        Distances, broadcast over the leading dimension.
+    """
+    distances: np.ndarray = np.sqrt(distance_squared_batch(points_a, points_b))
+    return distances
+
+
+def _transform_ndarrays(entities: Sequence[WDLEntity]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert entity transforms into contiguous (N, 3) position and scale arrays.
+
+    Entities are walked once; every later query reads the arrays instead of
+    chasing ``entity.transform.position`` attributes per entity.
+    """
+    rows = []
+    for e in entities:
+        pos = e.transform.position
+        scale = e.transform.scale
+        rows.append((pos.x, pos.y, pos.z, scale.x, scale.y, scale.z))
+    packed = np.array(rows, dtype=np.float64).reshape(-1, 6)
+    return np.ascontiguousarray(packed[:, :3]), np.ascontiguousarray(packed[:, 3:])
+
+
 class SpatialReasoner:
     """Utility class for spatial reasoning and entity placement.
 
     Provides methods for analyzing spatial relationships between entities,
     calculating optimal placements, and validating spatial constraints.
+
+    Entity positions and scales are snapshotted into arrays on first use.
+    Entities added or removed through the world's methods (or appended to
+    ``world.entities``) are picked up automatically, but moving, rescaling or
+    swapping existing entities is not: call :meth:`mark_dirty` afterwards.
     """
 
     def __init__(self, world: WDLWorld | None = None) -> None:
@@ -104,12 +365,282 @@ class SpatialReasoner:
         """
         self.world = world
         self._entity_bounds: dict[str, BoundingBox] = {}
+        self._dirty = True
+        # Snapshot of world.entities that the index arrays were built from,
+        # with the list object and world revision it was taken at.
+        self._indexed_entities: tuple[WDLEntity, ...] = ()
+        self._indexed_list: list[WDLEntity] | None = None
+        self._indexed_revision = -1
+        self._positions = np.empty((0, 3))
+        self._scales = np.empty((0, 3))
+        self._kdtree: Any = None
+        self._octree: LinearOctree | None = None
+        self._aabb_min = np.empty((0, 3))
+        self._aabb_max = np.empty((0, 3))
+        self._bvh: np.ndarray | None = None
+        # Python-list copies of the BVH node columns, valid while _bvh is set.
+        self._bvh_lists: tuple[list, list, list, list] = ([], [], [], [])
+        self._world_bounds_cache: BoundingBox | None = None
+        self._aabb_rows: tuple[dict[str, int], list[list[float]]] | None = None
 
     def set_world(self, world: WDLWorld) -> None:
         """Set or update the world to analyze."""
         self.world = world
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Mark cached entity data as stale after mutating the world.
+
+        Entities added or removed through the world's methods are detected
+        automatically. Call this after moving or rescaling entities, or after
+        editing ``world.entities`` directly other than by appending.
+        """
+        self._dirty = True
         self._entity_bounds.clear()
 
+    def refresh(self) -> None:
+        """Rebuild the entity snapshot and spatial index from the world now.
+
+        Equivalent to :meth:`mark_dirty` followed by the lazy rebuild that
+        the next query would trigger, so the rebuild cost is paid up front.
+        """
+        self.mark_dirty()
+        self._ensure_index()
+
+    def _ensure_index(self) -> np.ndarray:
+        """Build the structure-of-arrays index for the current world if stale.
+
+        Positions and scales are stored as contiguous (N, 3) arrays next to
+        the precomputed AABB corners and, when scipy is available, a k-d tree
+        for O(log N) point queries. The index is rebuilt lazily after
+        :meth:`mark_dirty`, when the world's revision changes or when the
+        entity list is replaced or changes length. If the old snapshot is
+        still a prefix of the list, only the appended entities are converted
+        and concatenated onto the existing arrays.
+
+        Returns:
+            The (N, 3) array of entity positions.
+        """
+        entities = self.world.entities if self.world else []
+        revision = self.world.revision if self.world else 0
+        indexed = self._indexed_entities
+        same_list = self.world is None or entities is self._indexed_list
+        if (
+            not self._dirty
+            and same_list
+            and revision == self._indexed_revision
+            and len(entities) == len(indexed)
+        ):
+            return self._positions
+
+        if (
+            not self._dirty
+            and same_list
+            and len(entities) > len(indexed) > 0
+            and all(map(operator.is_, indexed, entities))
+        ):
+            # Entities were only appended: convert just the new transforms.
+            added = list(entities[len(indexed) :])
+            new_positions, new_scales = _transform_ndarrays(added)
+            self._indexed_entities = indexed + tuple(added)
+            positions = np.concatenate([self._positions, new_positions])
+            scales = np.concatenate([self._scales, new_scales])
+        else:
+            self._indexed_entities = tuple(entities)
+            positions, scales = _transform_ndarrays(self._indexed_entities)
+        self._indexed_list = entities
+        self._indexed_revision = revision
+
+        half_sizes = scales / 2
+        self._positions = positions
+        self._scales = scales
+        self._aabb_min = positions - half_sizes
+        self._aabb_max = positions + half_sizes
+        self._kdtree = (
+            scipy.spatial.cKDTree(positions) if scipy is not None and len(positions) else None
+        )
+        self._octree = None
+        self._bvh = None
+        self._bvh_lists = ([], [], [], [])
+        self._aabb_rows = None
+        self._world_bounds_cache = None
+        self._dirty = False
+        return positions
+
+    def _get_octree(self) -> LinearOctree:
+        """Get the linear octree over entity positions, building it if needed."""
+        positions = self._ensure_index()
+        if self._octree is None:
+            self._octree = LinearOctree(positions)
+        return self._octree
+
+    def _get_aabb_rows(self) -> tuple[dict[str, int], list[list[float]]]:
+        """Get per-entity AABBs as Python rows, keyed by entity ID.
+
+        Pairwise checks touch only a handful of values, where plain list
+        indexing beats NumPy scalar access, so the precomputed AABB arrays are
+        exported once as ``[min.x, min.y, min.z, max.x, max.y, max.z]`` rows.
+
+        Returns:
+            Tuple of (entity ID to row index, AABB rows).
+        """
+        self._ensure_index()
+        if self._aabb_rows is None:
+            index_of = {e.id: i for i, e in enumerate(self._indexed_entities)}
+            rows = np.hstack([self._aabb_min, self._aabb_max]).tolist()
+            self._aabb_rows = (index_of, rows)
+        return self._aabb_rows
+
+    def _build_bvh(self) -> np.ndarray:
+        """Build an array-backed bounding volume hierarchy over entity AABBs.
+
+        Leaves are ordered by the Morton code of their AABB centers so that
+        spatially close entities end up in neighbouring subtrees, then
+        adjacent nodes are merged pairwise level by level. Nodes live in a
+        single structured array; the root is the last node.
+
+        Returns:
+            The BVH node array.
+        """
+        self._ensure_index()
+        if self._bvh is not None:
+            return self._bvh
+
+        aabb_min, aabb_max = self._aabb_min, self._aabb_max
+        count = len(aabb_min)
+        nodes = np.empty(max(2 * count - 1, 0), dtype=_BVH_NODE_DTYPE)
+        if not count:
+            self._bvh = nodes
+            self._bvh_lists = ([], [], [], [])
+            return nodes
+
+        order = np.argsort(morton_codes((aabb_min + aabb_max) / 2), kind="stable")
+        nodes["left"][:count] = order
+        nodes["right"][:count] = _BVH_LEAF
+        nodes["min"][:count] = aabb_min[order]
+        nodes["max"][:count] = aabb_max[order]
+
+        level = np.arange(count, dtype=np.uint32)
+        next_node = count
+        while len(level) > 1:
+            pairs = len(level) // 2
+            left = level[0 : 2 * pairs : 2]
+            right = level[1 : 2 * pairs : 2]
+            parents = np.arange(next_node, next_node + pairs, dtype=np.uint32)
+            nodes["left"][parents] = left
+            nodes["right"][parents] = right
+            nodes["min"][parents] = np.minimum(nodes["min"][left], nodes["min"][right])
+            nodes["max"][parents] = np.maximum(nodes["max"][left], nodes["max"][right])
+            next_node += pairs
+            level = np.concatenate([parents, level[2 * pairs :]])
+
+        self._bvh = nodes
+        # Traversal happens in Python, where list indexing beats NumPy scalars.
+        self._bvh_lists = (
+            nodes["left"].tolist(),
+            nodes["right"].tolist(),
+            nodes["min"].tolist(),
+            nodes["max"].tolist(),
+        )
+        return nodes
+
+    def _query_bvh(self, box_min: np.ndarray, box_max: np.ndarray) -> list[int]:
+        """Find indices of entities whose AABB overlaps the given box.
+
+        Args:
+            box_min: Minimum corner of the query box.
+            box_max: Maximum corner of the query box.
+
+        Returns:
+            Unordered list of overlapping entity indices.
+        """
+        nodes = self._build_bvh()
+        if not len(nodes):
+            return []
+
+        lo = box_min.tolist()
+        hi = box_max.tolist()
+        left, right, node_min, node_max = self._bvh_lists
+        leaf = int(_BVH_LEAF)
+
+        hits = []
+        stack = [len(nodes) - 1]
+        while stack:
+            node = stack.pop()
+            nmin = node_min[node]
+            nmax = node_max[node]
+            if (
+                nmin[0] <= hi[0]
+                and nmax[0] >= lo[0]
+                and nmin[1] <= hi[1]
+                and nmax[1] >= lo[1]
+                and nmin[2] <= hi[2]
+                and nmax[2] >= lo[2]
+            ):
+                if right[node] == leaf:
+                    hits.append(left[node])
+                else:
+                    stack.append(left[node])
+                    stack.append(right[node])
+        return hits
+
+    def _sweep_candidate_pairs(self) -> np.ndarray:
+        """Find entity index pairs whose AABBs overlap along the X axis.
+
+        Boxes are sorted by their minimum X; each box's candidates are the
+        run of later boxes that start before it ends, found with one
+        ``searchsorted`` call. Pairs overlapping on X still need the Y and Z
+        checks.
+
+        Returns:
+            Array of shape (M, 2) holding ``(i, j)`` index pairs.
+        """
+        self._ensure_index()
+        count = len(self._aabb_min)
+        order = np.argsort(self._aabb_min[:, 0], kind="stable")
+        starts = self._aabb_min[order, 0]
+        ends = np.searchsorted(starts, self._aabb_max[order, 0], side="right")
+
+        first = np.arange(count)
+        runs = np.maximum(ends - (first + 1), 0)
+        total = int(runs.sum())
+        # Expand every run [k + 1, ends[k]) into explicit sorted positions.
+        left = np.repeat(first, runs)
+        run_offsets = np.repeat(np.cumsum(runs) - runs, runs)
+        right = np.arange(total) - run_offsets + left + 1
+
+        pairs = np.empty((total, 2), dtype=np.int64)
+        pairs[:, 0] = order[left]
+        pairs[:, 1] = order[right]
+        return pairs
+
+    def _colliding_pairs(self) -> np.ndarray:
+        """Find index pairs of entities whose AABBs overlap.
+
+        Candidate pairs come from a sort-and-sweep along the X axis. The
+        remaining overlap tests run in a parallel JIT-compiled kernel when
+        numba is installed and there are at least
+        ``NUMBA_MIN_CANDIDATE_PAIRS`` candidates, and as a vectorized NumPy
+        check otherwise.
+
+        Returns:
+            Array of shape (K, 2) holding unordered ``(i, j)`` index pairs.
+        """
+        pairs = self._sweep_candidate_pairs()
+        if not len(pairs):
+            return pairs
+        if _overlapping_pairs_nb is not None and len(pairs) >= NUMBA_MIN_CANDIDATE_PAIRS:
+            overlap = _overlapping_pairs_nb(self._aabb_min, self._aabb_max, pairs)
+        else:
+            i, j = pairs[:, 0], pairs[:, 1]
+            overlap = np.all(
+                (self._aabb_min[i] <= self._aabb_max[j])
+                & (self._aabb_max[i] >= self._aabb_min[j]),
+                axis=1,
+            )
+        colliding: np.ndarray = pairs[overlap]
+        return colliding
+
     def get_entity_bounds(self, entity: WDLEntity) -> BoundingBox:
         """Get the bounding box for an entity.
 
@@ -147,32 +678,24 @@ class SpatialReasoner:
     def get_world_bounds(self) -> BoundingBox | None:
         """Get the overall bounds of the world based on entities.
 
+        The result is cached until entities are added or removed, or
+        :meth:`mark_dirty` is called.
+
         Returns:
             Bounding box containing all entities, or None if no entities.
         """
         if not self.world or not self.world.entities:
             return None
 
-        min_x = float("inf")
-        min_y = float("inf")
-        min_z = float("inf")
-        max_x = float("-inf")
-        max_y = float("-inf")
-        max_z = float("-inf")
-
-        for entity in self.world.entities:
-            bounds = self.get_entity_bounds(entity)
-            min_x = min(min_x, bounds.min_point.x)
-            min_y = min(min_y, bounds.min_point.y)
-            min_z = min(min_z, bounds.min_point.z)
-            max_x = max(max_x, bounds.max_point.x)
-            max_y = max(max_y, bounds.max_point.y)
-            max_z = max(max_z, bounds.max_point.z)
-
-        return BoundingBox(
-            min_point=Vector3(x=min_x, y=min_y, z=min_z),
-            max_point=Vector3(x=max_x, y=max_y, z=max_z),
-        )
+        self._ensure_index()
+        if self._world_bounds_cache is None:
+            lo = self._aabb_min.min(axis=0).tolist()
+            hi = self._aabb_max.max(axis=0).tolist()
+            self._world_bounds_cache = BoundingBox(
+                min_point=Vector3(x=lo[0], y=lo[1], z=lo[2]),
+                max_point=Vector3(x=hi[0], y=hi[1], z=hi[2]),
+            )
+        return self._world_bounds_cache
 
     def find_nearest_entity(self, position: Vector3) -> tuple[WDLEntity | None, float]:
         """Find the nearest entity to a given position.
@@ -186,16 +709,18 @@ class SpatialReasoner:
         if not self.world:
             return None, float("inf")
 
-        nearest = None
-        nearest_dist = float("inf")
+        positions = self._ensure_index()
+        if not len(positions):
+            return None, float("inf")
 
-        for entity in self.world.entities:
-            dist = distance(position, entity.transform.position)
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest = entity
+        if self._kdtree is not None:
+            nearest_dist, index = self._kdtree.query((position.x, position.y, position.z), k=1)
+        else:
+            dist_sq = distance_squared_arr(positions, position)
+            index = int(np.argmin(dist_sq))
+            nearest_dist = math.sqrt(dist_sq[index])
 
-        return nearest, nearest_dist
+        return self._indexed_entities[int(index)], float(nearest_dist)
 
     def find_entities_in_radius(self, center: Vector3, radius: float) -> list[WDLEntity]:
         """Find all entities within a radius of a point.
@@ -210,12 +735,20 @@ class SpatialReasoner:
         if not self.world:
             return []
 
-        radius_sq = radius * radius
-        return [
-            e
-            for e in self.world.entities
-            if distance_squared(center, e.transform.position) <= radius_sq
-        ]
+        positions = self._ensure_index()
+        if not len(positions):
+            return []
+
+        query = (center.x, center.y, center.z)
+        if self._kdtree is not None:
+            indices = sorted(self._kdtree.query_ball_point(query, radius))
+        elif len(positions) >= OCTREE_MIN_ENTITIES:
+            indices = self._get_octree().query_radius(np.array(query), radius).tolist()
+        else:
+            dist_sq = distance_squared_arr(positions, center)
+            indices = np.flatnonzero(dist_sq <= radius * radius).tolist()
+
+        return [self._indexed_entities[i] for i in indices]
 
     def find_entities_in_bounds(self, bounds: BoundingBox) -> list[WDLEntity]:
         """Find all entities within a bounding box.
@@ -229,7 +762,13 @@ class SpatialReasoner:
         if not self.world:
             return []
 
-        return [e for e in self.world.entities if bounds.contains_point(e.transform.position)]
+        positions = self._ensure_index()
+        if len(positions) >= OCTREE_MIN_ENTITIES:
+            packed = bounds.as_array()
+            indices = self._get_octree().query_box(packed[:3], packed[3:])
+        else:
+            indices = np.flatnonzero(bounds.contains_point_batch(positions))
+        return [self._indexed_entities[i] for i in indices]
 
     def check_collision(self, entity1: WDLEntity, entity2: WDLEntity) -> bool:
         """Check if two entities collide (their bounds intersect).
@@ -241,6 +780,34 @@ class SpatialReasoner:
         Returns:
             True if entities collide, False otherwise.
         """
+        # The row snapshot stays valid until mark_dirty(): rows are matched to
+        # entities by identity, so added or removed entities cannot alias them.
+        cache = self._aabb_rows
+        if (cache is None or self._dirty) and self.world:
+            cache = self._get_aabb_rows()
+        if cache is not None:
+            index_of, rows = cache
+            i = index_of.get(entity1.id)
+            j = index_of.get(entity2.id)
+            entities = self._indexed_entities
+            if (
+                i is not None
+                and j is not None
+                and entities[i] is entity1
+                and entities[j] is entity2
+            ):
+                a = rows[i]
+                b = rows[j]
+                return (
+                    a[0] <= b[3]
+                    and a[3] >= b[0]
+                    and a[1] <= b[4]
+                    and a[4] >= b[1]
+                    and a[2] <= b[5]
+                    and a[5] >= b[2]
+                )
+
+        # Entities outside the indexed world are measured directly.
         bounds1 = self.get_entity_bounds(entity1)
         bounds2 = self.get_entity_bounds(entity2)
         return bounds1.intersects(bounds2)
@@ -257,28 +824,47 @@ class SpatialReasoner:
         if not self.world:
             return []
 
-        return [
-            e for e in self.world.entities if e.id != entity.id and self.check_collision(entity, e)
-        ]
+        bounds = self.get_entity_bounds(entity)
+        self._ensure_index()
+        if len(self._indexed_entities) < BVH_MIN_ENTITIES:
+            mask = bounds.intersects_batch(self._aabb_min, self._aabb_max)
+            hits = np.flatnonzero(mask).tolist()
+        else:
+            box = bounds.as_array()
+            hits = sorted(self._query_bvh(box[:3], box[3:]))
+
+        entities = self._indexed_entities
+        return [entities[i] for i in hits if entities[i].id != entity.id]
 
     def find_all_collisions(self) -> list[tuple[WDLEntity, WDLEntity]]:
         """Find all pairs of colliding entities in the world.
 
+        Uses a sort-and-sweep broad phase along the X axis, so only pairs
+        whose X extents overlap are tested in full; sparse worlds cost
+        O(N log N + K) for K candidate pairs instead of O(N^2).
+
         Returns:
-            List of tuples containing colliding entity pairs.
+            List of tuples containing colliding entity pairs, ordered as the
+            pairwise loop over ``world.entities`` would produce them.
         """
         if not self.world:
             return []
 
-        collisions = []
-        entities = self.world.entities
+        pairs = np.sort(self._colliding_pairs(), axis=1)
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+        entities = self._indexed_entities
+        return [(entities[a], entities[b]) for a, b in pairs.tolist()]
 
-        for i, entity1 in enumerate(entities):
-            for entity2 in entities[i + 1 :]:
-                if self.check_collision(entity1, entity2):
-                    collisions.append((entity1, entity2))
+    def count_collisions(self) -> int:
+        """Count colliding entity pairs without materializing them.
 
-        return collisions
+        Returns:
+            Number of colliding entity pairs.
+        """
+        if not self.world:
+            return 0
+        return len(self._colliding_pairs())
 
     def suggest_placement(
         self,
@@ -303,27 +889,41 @@ class SpatialReasoner:
         if not world_bounds:
             return Vector3(x=0, y=preferred_y, z=0)
 
-        # Try positions in a grid pattern
+        # Try positions on rings of growing radius around the origin. Rings are
+        # tested in batches: the first candidate whose nearest entity is far
+        # enough away wins, found with one k-d tree query per batch when scipy
+        # is available and a vectorized scan per candidate otherwise.
         search_range = max(world_bounds.size.x, world_bounds.size.z) * 2
         step = min_distance_from_others
-
-        for r in range(int(search_range / step)):
-            radius = r * step
-            for angle in range(0, 360, 30):
-                rad = math.radians(angle)
-                x = radius * math.cos(rad)
-                z = radius * math.sin(rad)
-                candidate = Vector3(x=x, y=preferred_y, z=z)
-
-                # Check if position is valid
-                is_valid = True
-                for entity in self.world.entities:
-                    if distance(candidate, entity.transform.position) < min_distance_from_others:
-                        is_valid = False
-                        break
-
-                if is_valid:
-                    return candidate
+        ring_count = int(search_range / step)
+        positions = self._ensure_index()
+
+        for first_ring in range(0, ring_count, _PLACEMENT_RING_BATCH):
+            last_ring = min(first_ring + _PLACEMENT_RING_BATCH, ring_count)
+            radii = np.arange(first_ring, last_ring) * step
+            candidates = np.empty((len(radii) * len(_PLACEMENT_DIRECTIONS), 3))
+            candidates[:, 0] = np.outer(radii, _PLACEMENT_DIRECTIONS[:, 0]).ravel()
+            candidates[:, 1] = preferred_y
+            candidates[:, 2] = np.outer(radii, _PLACEMENT_DIRECTIONS[:, 1]).ravel()
+
+            if self._kdtree is not None:
+                nearest, _ = self._kdtree.query(candidates, k=1)
+                valid = np.flatnonzero(nearest >= min_distance_from_others).tolist()
+                index = valid[0] if valid else None
+            else:
+                index = next(
+                    (
+                        i
+                        for i, candidate in enumerate(candidates)
+                        if math.sqrt(distance_squared_batch(candidate, positions).min())
+                        >= min_distance_from_others
+                    ),
+                    None,
+                )
+
+            if index is not None:
+                x, y, z = candidates[index].tolist()
+                return Vector3(x=x, y=y, z=z)
 
         return None
 
@@ -363,7 +963,7 @@ class SpatialReasoner:
         collisions = self.find_all_collisions()
 
         return {
-            "entity_count": len(self.world.entities),
+            "entity_count": len(self._indexed_entities),
             "world_bounds": {
                 "min": {
                     "x": world_bounds.min_point.x,
@@ -1,8 +1,9 @@
 """Tests for the tools module."""
 
-import tempfile
-from pathlib import Path
+import json
+from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
 from omniworld_builder.core.wdl_schema import (
@@ -12,17 +13,24 @@ from omniworld_builder.core.wdl_schema import (
     WDLMetadata,
     WDLWorld,
 )
+from omniworld_builder.tools import asset_registry, spatial_reasoning
 from omniworld_builder.tools.asset_registry import (
+    MANIFEST_SCHEMA_VERSION,
+    SEARCH_CACHE_SIZE,
     Asset,
     AssetPlatformInfo,
     AssetRegistry,
     AssetType,
 )
+from omniworld_builder.tools.octree import LinearOctree
 from omniworld_builder.tools.spatial_reasoning import (
     BoundingBox,
     SpatialReasoner,
     distance,
+    distance_batch,
     distance_squared,
+    distance_squared_arr,
+    distance_squared_batch,
 )
 
 
@@ -55,6 +63,23 @@ class TestAsset:
         assert asset.has_platform_support("unreal")
         assert not asset.has_platform_support("horizon")
 
+    def test_platform_info_validated_from_dict(self):
+        """Test that platform info dicts are coerced and dumped back to dicts."""
+        asset = Asset.model_validate(
+            {
+                "id": "test_asset_01",
+                "name": "Test Asset",
+                "asset_type": "model_3d",
+                "platform_info": {"unity": {"path": "test.fbx", "format": "fbx"}},
+            }
+        )
+        info = asset.platform_info["unity"]
+        assert isinstance(info, AssetPlatformInfo)
+        assert info == AssetPlatformInfo(path="test.fbx", format="fbx")
+        with pytest.raises(AttributeError):
+            info.path = "other.fbx"  # type: ignore[misc]
+        assert asset.model_dump()["platform_info"]["unity"]["lod_levels"] == 1
+
     def test_get_platform_path(self):
         """Test getting platform-specific path."""
         asset = Asset(
@@ -73,98 +98,378 @@ class TestAsset:
 class TestAssetRegistry:
     """Tests for AssetRegistry."""
 
-    def test_register_and_get(self):
-        """Test registering and retrieving an asset."""
+    @pytest.fixture(scope="module")
+    def sample_registry(self):
+        """Create a registry shared by the read-only tests in this module."""
         registry = AssetRegistry()
+        registry.register_many(
+            [
+                Asset(
+                    id="tree_01",
+                    name="Oak Tree",
+                    description="A large oak tree",
+                    asset_type=AssetType.MODEL_3D,
+                    tags=["vegetation"],
+                ),
+                Asset(
+                    id="tree_02",
+                    name="Pine Tree",
+                    asset_type=AssetType.MODEL_3D,
+                    tags=["vegetation"],
+                ),
+                Asset(
+                    id="rock_01",
+                    name="Rock",
+                    description="A mossy rock",
+                    asset_type=AssetType.MODEL_3D,
+                    tags=["prop"],
+                ),
+                Asset(id="tex_01", name="Texture", asset_type=AssetType.TEXTURE),
+            ]
+        )
+        return registry
+
+    @pytest.fixture
+    def mutable_registry(self, sample_registry):
+        """Create a private copy of the sample registry for tests that mutate it."""
+        registry = AssetRegistry()
+        registry.register_many(a.model_copy(deep=True) for a in sample_registry.list_all())
+        return registry
+
+    def test_register_and_get(self, mutable_registry):
+        """Test registering and retrieving an asset."""
         asset = Asset(
             id="test_01",
             name="Test",
             asset_type=AssetType.MODEL_3D,
         )
-        registry.register(asset)
-        retrieved = registry.get("test_01")
+        mutable_registry.register(asset)
+        retrieved = mutable_registry.get("test_01")
         assert retrieved is not None
         assert retrieved.name == "Test"
 
-    def test_unregister(self):
+    def test_unregister(self, mutable_registry, sample_registry):
         """Test unregistering an asset."""
-        registry = AssetRegistry()
-        asset = Asset(id="test_01", name="Test", asset_type=AssetType.MODEL_3D)
-        registry.register(asset)
-        assert registry.unregister("test_01") is True
-        assert registry.get("test_01") is None
-        assert registry.unregister("non_existent") is False
+        assert mutable_registry.unregister("rock_01") is True
+        assert mutable_registry.get("rock_01") is None
+        assert mutable_registry.get_by_tag("prop") == []
+        assert mutable_registry.unregister("non_existent") is False
+        assert sample_registry.get("rock_01") is not None
 
-    def test_get_by_tag(self):
+    def test_get_by_tag(self, sample_registry):
         """Test getting assets by tag."""
+        vegetation = sample_registry.get_by_tag("vegetation")
+        assert len(vegetation) == 2
+
+    def test_register_interns_repeated_strings(self):
+        """Test that equal tags and platform strings share one object."""
         registry = AssetRegistry()
-        registry.register(
-            Asset(id="tree_01", name="Oak Tree", asset_type=AssetType.MODEL_3D, tags=["vegetation"])
+        for i in range(2):
+            registry.register(
+                Asset(
+                    id=f"tree_{i}",
+                    name="Tree",
+                    asset_type=AssetType.MODEL_3D,
+                    tags=["".join(["vege", "tation"])],
+                    platform_info={
+                        "".join(["un", "ity"]): AssetPlatformInfo(
+                            path=f"tree_{i}.fbx", format="".join(["f", "bx"])
+                        )
+                    },
+                )
+            )
+
+        first, second = registry.get("tree_0"), registry.get("tree_1")
+        assert first.tags[0] is second.tags[0]
+        assert next(iter(first.platform_info)) is next(iter(second.platform_info))
+        assert first.platform_info["unity"].format is second.platform_info["unity"].format
+        assert first.get_platform_path("unity") == "tree_0.fbx"
+
+    def test_register_leaves_fields_set_unchanged(self):
+        """Test that interning on register does not mark defaulted fields as set."""
+        asset = Asset(id="rock", name="Rock", asset_type=AssetType.MODEL_3D)
+        explicit = Asset(
+            id="tree",
+            name="Tree",
+            asset_type=AssetType.MODEL_3D,
+            tags=["vegetation"],
+            source_path="tree.fbx",
+            platform_info={"unity": AssetPlatformInfo(path="tree.fbx", format="fbx")},
+        )
+        fields_set = (set(asset.model_fields_set), set(explicit.model_fields_set))
+        platform_info = explicit.platform_info
+
+        registry = AssetRegistry()
+        registry.register_many([asset, explicit])
+
+        assert (asset.model_fields_set, explicit.model_fields_set) == fields_set
+        assert asset.model_dump(exclude_unset=True) == {
+            "id": "rock",
+            "name": "Rock",
+            "asset_type": AssetType.MODEL_3D,
+        }
+        assert explicit.platform_info is platform_info
+
+    def test_get_by_type(self, sample_registry):
+        """Test getting assets by type."""
+        models = sample_registry.get_by_type(AssetType.MODEL_3D)
+        assert len(models) == 3
+        assert [a.id for a in sample_registry.get_by_type(AssetType.TEXTURE)] == ["tex_01"]
+
+    def test_search(self, sample_registry):
+        """Test searching assets."""
+        # Search by query
+        results = sample_registry.search(query="oak")
+        assert len(results) == 1
+        assert results[0].id == "tree_01"
+
+        # Search by type and tags
+        results = sample_registry.search(asset_type=AssetType.MODEL_3D, tags=["prop"])
+        assert len(results) == 1
+        assert results[0].id == "rock_01"
+
+    def test_search_query_matches_name_or_description(self):
+        """Test text search across names and descriptions of many assets."""
+        registry = AssetRegistry()
+        for i in range(50):
+            registry.register(
+                Asset(
+                    id=f"asset_{i:02d}",
+                    name=f"Crate {i}",
+                    description="Mossy" if i % 10 == 0 else "Plain",
+                    asset_type=AssetType.MODEL_3D,
+                )
+            )
+
+        assert [a.id for a in registry.search(query="MOSS")] == [
+            "asset_00",
+            "asset_10",
+            "asset_20",
+            "asset_30",
+            "asset_40",
+        ]
+        assert len(registry.search(query="crate")) == 50
+        assert [a.id for a in registry.search(query="crate 49")] == ["asset_49"]
+        # Matches never span the boundary between a name and a description.
+        assert registry.search(query="49plain") == []
+
+        registry.unregister("asset_10")
+        assert len(registry.search(query="mossy")) == 4
+
+    def test_register_many(self):
+        """Test bulk registration matches registering one by one."""
+        registry = AssetRegistry()
+        registry.register(Asset(id="rock_01", name="Rock", asset_type=AssetType.MODEL_3D))
+        assert len(registry.search(query="rock")) == 1
+
+        count = registry.register_many(
+            [
+                Asset(id="rock_02", name="Rock", asset_type=AssetType.MODEL_3D),
+                Asset(id="rock_01", name="Boulder", asset_type=AssetType.PREFAB),
+            ]
         )
+        assert count == 2
+        assert registry.count() == 2
+        assert [a.id for a in registry.search(query="rock")] == ["rock_02"]
+        assert [a.id for a in registry.get_by_type(AssetType.PREFAB)] == ["rock_01"]
+
+    def test_reregister_replaces_index_entries(self):
+        """Test that re-registering an asset drops its stale tags."""
+        registry = AssetRegistry()
         registry.register(
-            Asset(id="tree_02", name="Pine Tree", asset_type=AssetType.MODEL_3D, tags=["vegetation"])
+            Asset(id="tree_01", name="Oak", asset_type=AssetType.MODEL_3D, tags=["vegetation"])
         )
         registry.register(
-            Asset(id="rock_01", name="Rock", asset_type=AssetType.MODEL_3D, tags=["prop"])
+            Asset(id="tree_01", name="Oak", asset_type=AssetType.PREFAB, tags=["prop"])
         )
 
-        vegetation = registry.get_by_tag("vegetation")
-        assert len(vegetation) == 2
+        assert registry.count() == 1
+        assert registry.get_by_tag("vegetation") == []
+        assert [a.id for a in registry.get_by_tag("prop")] == ["tree_01"]
+        assert registry.get_by_type(AssetType.MODEL_3D) == []
+        assert len(registry.search(asset_type=AssetType.PREFAB, tags=["prop"])) == 1
 
-    def test_get_by_type(self):
-        """Test getting assets by type."""
+    def test_search_cache_invalidated_on_register(self):
+        """Test that cached search results reflect later registrations."""
         registry = AssetRegistry()
-        registry.register(Asset(id="model_01", name="Model", asset_type=AssetType.MODEL_3D))
-        registry.register(Asset(id="tex_01", name="Texture", asset_type=AssetType.TEXTURE))
-        registry.register(Asset(id="model_02", name="Model2", asset_type=AssetType.MODEL_3D))
+        registry.register(Asset(id="tree_01", name="Oak Tree", asset_type=AssetType.MODEL_3D))
 
-        models = registry.get_by_type(AssetType.MODEL_3D)
-        assert len(models) == 2
+        results = registry.search(query="tree")
+        assert len(results) == 1
+        results.clear()
+        assert len(registry.search(query="TREE")) == 1
 
-    def test_search(self):
-        """Test searching assets."""
+        registry.register(Asset(id="tree_02", name="Pine Tree", asset_type=AssetType.MODEL_3D))
+        assert len(registry.search(query="tree")) == 2
+
+        registry.unregister("tree_01")
+        assert [a.id for a in registry.search(query="tree")] == ["tree_02"]
+
+    def test_search_cache_stays_bounded_across_mutations(self):
+        """Test that stale search cache entries age out of the LRU."""
+        registry = AssetRegistry()
+        for i in range(SEARCH_CACHE_SIZE + 10):
+            registry.register(Asset(id=f"tree_{i}", name="Tree", asset_type=AssetType.MODEL_3D))
+            assert len(registry.search(query="tree")) == i + 1
+        assert len(registry._search_cache) == SEARCH_CACHE_SIZE
+
+    def test_save_and_load(self, tmp_path):
+        """Test saving and loading registry."""
+        registry = AssetRegistry()
+        registry.register(Asset(id="test_01", name="Test", asset_type=AssetType.MODEL_3D))
+
+        path = tmp_path / "registry.json"
+        registry.save(path)
+
+        new_registry = AssetRegistry()
+        count = new_registry.load(path)
+        assert count == 1
+        assert new_registry.get("test_01") is not None
+
+    def test_save_numpy_metadata(self, tmp_path):
+        """Test that NumPy values in asset metadata are saved as plain JSON."""
         registry = AssetRegistry()
         registry.register(
             Asset(
-                id="tree_01",
-                name="Oak Tree",
-                description="A large oak tree",
+                id="test_01",
+                name="Test",
                 asset_type=AssetType.MODEL_3D,
-                tags=["vegetation"],
+                metadata={"extent": np.array([1.0, 2.5]), "lods": np.int64(3)},
             )
         )
+        path = tmp_path / "registry.json"
+        registry.save(path)
+
+        loaded = AssetRegistry()
+        assert loaded.load(path) == 1
+        assert loaded.get("test_01").metadata == {"extent": [1.0, 2.5], "lods": 3}
+
+    def test_load_builds_full_assets(self, tmp_path):
+        """Test that trusted and validated loads produce equivalent assets."""
+        registry = AssetRegistry()
         registry.register(
             Asset(
-                id="rock_01",
-                name="Rock",
-                description="A mossy rock",
+                id="test_01",
+                name="Test",
                 asset_type=AssetType.MODEL_3D,
                 tags=["prop"],
+                platform_info={"unity": AssetPlatformInfo(path="a.fbx", format="fbx")},
             )
         )
 
-        # Search by query
-        results = registry.search(query="oak")
-        assert len(results) == 1
-        assert results[0].id == "tree_01"
+        path = tmp_path / "registry.json"
+        registry.save(path)
 
-        # Search by type and tags
-        results = registry.search(asset_type=AssetType.MODEL_3D, tags=["vegetation"])
-        assert len(results) == 1
+        trusted = AssetRegistry()
+        trusted.load(path)
+        validated = AssetRegistry()
+        validated.load(path, validate=True)
 
-    def test_save_and_load(self):
-        """Test saving and loading registry."""
+        asset = trusted.get("test_01")
+        assert isinstance(asset, Asset)
+        assert asset.asset_type is AssetType.MODEL_3D
+        assert isinstance(asset.platform_info["unity"], AssetPlatformInfo)
+        assert asset.get_platform_path("unity") == "a.fbx"
+        assert asset == validated.get("test_01")
+        assert [a.id for a in trusted.get_by_type(AssetType.MODEL_3D)] == ["test_01"]
+
+    def test_repeated_save_reflects_reregistered_asset(self, tmp_path):
+        """Test that saving after re-registration writes the new asset."""
         registry = AssetRegistry()
-        registry.register(Asset(id="test_01", name="Test", asset_type=AssetType.MODEL_3D))
+        registry.register(Asset(id="test_01", name="Old", asset_type=AssetType.MODEL_3D))
+
+        path = tmp_path / "registry.json"
+        registry.save(path)
+        registry.register(Asset(id="test_01", name="New", asset_type=AssetType.MODEL_3D))
+        registry.save(path)
+
+        new_registry = AssetRegistry()
+        new_registry.load(path)
+        loaded = new_registry.get("test_01")
+        assert loaded is not None
+        assert loaded.name == "New"
+
+    def test_save_reflects_in_place_edits(self, tmp_path):
+        """Test that assets edited in place are saved with their current fields."""
+        registry = AssetRegistry()
+        registry.register(Asset(id="test_01", name="Old", asset_type=AssetType.MODEL_3D))
+
+        path = tmp_path / "registry.json"
+        registry.save(path)
+        asset = registry.get("test_01")
+        asset.name = "New"
+        asset.tags.append("prop")
+        registry.save(path)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "registry.json"
-            registry.save(path)
+        new_registry = AssetRegistry()
+        new_registry.load(path)
+        loaded = new_registry.get("test_01")
+        assert loaded.name == "New"
+        assert loaded.tags == ["prop"]
+
+    def test_saved_file_is_plain_json(self, tmp_path):
+        """Test that the saved registry round-trips through the stdlib decoder."""
+        registry = AssetRegistry()
+        registry.register(
+            Asset(
+                id="test_01",
+                name="Test",
+                asset_type=AssetType.MODEL_3D,
+                tags=["prop"],
+                metadata={"poly_count": 1200, "lods": [1.0, 0.5]},
+                platform_info={"unity": AssetPlatformInfo(path="a.fbx", format="fbx")},
+            )
+        )
+
+        path = tmp_path / "registry.json"
+        registry.save(path)
+        assert json.loads(path.read_text()) == registry.export_manifest()
+
+    def test_save_backends_write_the_same_manifest(self, tmp_path, monkeypatch):
+        """Test that the orjson and stdlib encoders agree on awkward metadata."""
+        pytest.importorskip("orjson")
+        registry = AssetRegistry()
+        registry.register(
+            Asset(
+                id="test_01",
+                name="Café",
+                asset_type=AssetType.MODEL_3D,
+                metadata={
+                    "lods": {0: "high", 1: "low"},
+                    "scale": float("nan"),
+                    "bounds": np.array([1.5, np.inf]),
+                    "created": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+                    "kind": AssetType.TEXTURE,
+                },
+            )
+        )
+        fast_path, stdlib_path = tmp_path / "orjson.json", tmp_path / "stdlib.json"
+        registry.save(fast_path)
+        monkeypatch.setattr(asset_registry, "orjson", None)
+        registry.save(stdlib_path)
+
+        saved = json.loads(fast_path.read_bytes())
+        assert json.loads(stdlib_path.read_bytes()) == saved
+        assert saved["assets"][0]["metadata"] == {
+            "lods": {"0": "high", "1": "low"},
+            "scale": None,
+            "bounds": [1.5, None],
+            "created": "2024-05-01T12:30:00+00:00",
+            "kind": "texture",
+        }
+
+    def test_load_raw_utf8_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the stdlib fallback decodes saved files as UTF-8."""
+        monkeypatch.setattr(asset_registry, "orjson", None)
+        registry = AssetRegistry()
+        registry.register(Asset(id="cafe", name="Café über", asset_type=AssetType.MODEL_3D))
+        path = tmp_path / "registry.json"
+        # Raw UTF-8, as orjson writes it, rather than the stdlib's ASCII escapes.
+        path.write_bytes(json.dumps(registry.export_manifest(), ensure_ascii=False).encode())
 
-            new_registry = AssetRegistry()
-            count = new_registry.load(path)
-            assert count == 1
-            assert new_registry.get("test_01") is not None
+        loaded = AssetRegistry()
+        assert loaded.load(path) == 1
+        assert loaded.get("cafe").name == "Café über"
 
     def test_get_by_name(self):
         """Test getting assets by name."""
@@ -187,30 +492,17 @@ class TestAssetRegistry:
         registry.register(Asset(id="test_02", name="Asset2", asset_type=AssetType.TEXTURE))
         assert registry.count() == 2
 
-    def test_get_all_tags(self):
+    def test_get_all_tags(self, sample_registry):
         """Test getting all unique tags."""
-        registry = AssetRegistry()
-        registry.register(
-            Asset(id="test_01", name="Asset1", asset_type=AssetType.MODEL_3D, tags=["tag1", "tag2"])
-        )
-        registry.register(
-            Asset(id="test_02", name="Asset2", asset_type=AssetType.MODEL_3D, tags=["tag2", "tag3"])
-        )
+        tags = sample_registry.get_all_tags()
+        assert len(tags) == 2
+        assert "vegetation" in tags
+        assert "prop" in tags
 
-        tags = registry.get_all_tags()
-        assert len(tags) == 3
-        assert "tag1" in tags
-        assert "tag2" in tags
-        assert "tag3" in tags
-
-    def test_list_all(self):
+    def test_list_all(self, sample_registry):
         """Test listing all assets."""
-        registry = AssetRegistry()
-        registry.register(Asset(id="test_01", name="Asset1", asset_type=AssetType.MODEL_3D))
-        registry.register(Asset(id="test_02", name="Asset2", asset_type=AssetType.TEXTURE))
-
-        all_assets = registry.list_all()
-        assert len(all_assets) == 2
+        all_assets = sample_registry.list_all()
+        assert len(all_assets) == 4
 
     def test_search_by_multiple_tags(self):
         """Test searching assets with multiple tags (AND logic)."""
@@ -266,6 +558,19 @@ class TestAssetRegistry:
         assert len(results) == 1
         assert results[0].id == "test_01"
 
+        registry.unregister("test_01")
+        assert registry.search(platform="unity") == []
+        assert [a.id for a in registry.search(platform="unreal")] == ["test_02"]
+
+    def test_get_all_tags_after_unregister(self, mutable_registry):
+        """Test that tags disappear once no asset carries them."""
+        mutable_registry.unregister("tree_01")
+        assert sorted(mutable_registry.get_all_tags()) == ["prop", "vegetation"]
+
+        mutable_registry.unregister("tree_02")
+        assert mutable_registry.get_all_tags() == ["prop"]
+        assert mutable_registry.search(tags=["vegetation"]) == []
+
     def test_export_import_manifest(self):
         """Test exporting and importing manifest."""
         registry = AssetRegistry()
@@ -291,73 +596,236 @@ class TestAssetRegistry:
         assert new_registry.count() == 1
         assert new_registry.get("test_01") is not None
 
+    def test_import_manifest_rejects_incomplete_assets(self):
+        """Test that entries missing required fields are skipped, stamped or not."""
+        incomplete = {"assets": [{"id": "test_01", "asset_type": "model_3d"}]}
+        stamped = dict(incomplete, schema_version=MANIFEST_SCHEMA_VERSION)
+
+        assert AssetRegistry().import_manifest(incomplete) == 0
+        assert AssetRegistry().import_manifest(stamped, validate=True) == 0
+        registry = AssetRegistry()
+        assert registry.import_manifest(stamped) == 0
+        assert registry.search(query="test") == []
+
+    def test_import_stamped_manifest_skips_malformed_entries(self):
+        """Test that a stamped manifest keeps importing past wrongly typed entries."""
+        good = {"id": "ok", "name": "Rock", "asset_type": "model_3d", "tags": ["stone"]}
+        manifest = {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "assets": [
+                {"id": "bad_tags", "name": "Bad", "asset_type": "model_3d", "tags": [1]},
+                {"id": "bad_name", "name": None, "asset_type": "model_3d"},
+                {"id": "bad_type", "name": "Bad", "asset_type": "unknown"},
+                good,
+            ],
+        }
+        registry = AssetRegistry()
+        assert registry.import_manifest(manifest) == 1
+        assert [a.id for a in registry.search(query="rock", tags=["stone"])] == ["ok"]
+
+    def test_import_stamped_manifest_falls_back_to_validation(self):
+        """Test that trusted entries failing the fast checks are validated, not dropped."""
+        manifest = {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "assets": [
+                {
+                    "id": "extra_key",
+                    "name": "Tree",
+                    "asset_type": "model_3d",
+                    "platform_info": {
+                        "unity": {"path": "tree.fbx", "format": "fbx", "checksum": "abc"}
+                    },
+                },
+                {
+                    "id": "loose_types",
+                    "name": "Rock",
+                    "asset_type": "model_3d",
+                    "platform_info": {
+                        "godot": {
+                            "path": "rock.glb",
+                            "format": "glb",
+                            "optimized": "true",
+                            "lod_levels": "3",
+                        }
+                    },
+                },
+                {
+                    "id": "bad_lods",
+                    "name": "Bush",
+                    "asset_type": "model_3d",
+                    "platform_info": {
+                        "godot": {"path": "bush.glb", "format": "glb", "lod_levels": "many"}
+                    },
+                },
+            ],
+        }
+        registry = AssetRegistry()
+        assert registry.import_manifest(manifest) == 2
+        assert registry.get("extra_key").platform_info["unity"] == AssetPlatformInfo(
+            path="tree.fbx", format="fbx"
+        )
+        loose = registry.get("loose_types").platform_info["godot"]
+        assert loose.optimized is True
+        assert loose.lod_levels == 3
+        assert registry.get("bad_lods") is None
+
 
 class TestBoundingBox:
     """Tests for BoundingBox."""
 
-    def test_center(self):
-        """Test calculating bounding box center."""
-        bbox = BoundingBox(
-            min_point=Vector3(x=0, y=0, z=0),
-            max_point=Vector3(x=10, y=10, z=10),
-        )
-        center = bbox.center
-        assert center.x == 5
-        assert center.y == 5
-        assert center.z == 5
-
-    def test_size(self):
-        """Test calculating bounding box size."""
-        bbox = BoundingBox(
-            min_point=Vector3(x=0, y=0, z=0),
-            max_point=Vector3(x=10, y=20, z=30),
-        )
-        size = bbox.size
-        assert size.x == 10
-        assert size.y == 20
-        assert size.z == 30
-
-    def test_volume(self):
-        """Test calculating bounding box volume."""
-        bbox = BoundingBox(
-            min_point=Vector3(x=0, y=0, z=0),
-            max_point=Vector3(x=10, y=10, z=10),
-        )
+    @pytest.fixture(scope="module")
+    def canonical_bboxes(self):
+        """Create the named boxes shared by the tests in this class."""
+        return {
+            "cube": BoundingBox(
+                min_point=Vector3(x=0, y=0, z=0),
+                max_point=Vector3(x=10, y=10, z=10),
+            ),
+            "box": BoundingBox(
+                min_point=Vector3(x=0, y=0, z=0),
+                max_point=Vector3(x=10, y=20, z=30),
+            ),
+            "overlapping": BoundingBox(
+                min_point=Vector3(x=5, y=5, z=5),
+                max_point=Vector3(x=15, y=15, z=15),
+            ),
+            "far": BoundingBox(
+                min_point=Vector3(x=20, y=20, z=20),
+                max_point=Vector3(x=30, y=30, z=30),
+            ),
+        }
+
+    @pytest.mark.parametrize(
+        "name,center,size,volume",
+        [
+            ("cube", (5, 5, 5), (10, 10, 10), 1000),
+            ("box", (5, 10, 15), (10, 20, 30), 6000),
+        ],
+    )
+    def test_derived_properties(self, canonical_bboxes, name, center, size, volume):
+        """Test calculating bounding box center, size and volume."""
+        bbox = canonical_bboxes[name]
+        assert bbox.center == Vector3(*center)
+        assert bbox.size == Vector3(*size)
+        assert bbox.volume == volume
+
+    def test_immutable_with_bounds(self, canonical_bboxes):
+        """Test that boxes are frozen and with_bounds derives a new box."""
+        bbox = canonical_bboxes["cube"]
         assert bbox.volume == 1000
+        with pytest.raises(AttributeError):
+            bbox.max_point = Vector3(x=1, y=1, z=1)  # type: ignore[misc]
 
-    def test_contains_point(self):
-        """Test point containment check."""
-        bbox = BoundingBox(
-            min_point=Vector3(x=0, y=0, z=0),
-            max_point=Vector3(x=10, y=10, z=10),
-        )
-        assert bbox.contains_point(Vector3(x=5, y=5, z=5)) is True
-        assert bbox.contains_point(Vector3(x=15, y=5, z=5)) is False
+        grown = bbox.with_bounds(max_point=Vector3(x=20, y=10, z=10))
+        assert grown.min_point == bbox.min_point
+        assert grown.volume == 2000
+        assert bbox.volume == 1000
+        assert not hasattr(bbox, "__dict__")
+        assert bbox == BoundingBox(min_point=bbox.min_point, max_point=bbox.max_point)
+
+    @pytest.mark.parametrize(
+        "point,expected",
+        [
+            ((5, 5, 5), True),
+            ((15, 5, 5), False),
+            ((10, 0, 10), True),
+            ((5, -1, 5), False),
+        ],
+    )
+    def test_contains_point(self, canonical_bboxes, point, expected):
+        """Test point containment check, scalar and vectorized."""
+        bbox = canonical_bboxes["cube"]
+        assert bbox.contains_point(Vector3(*point)) is expected
+        assert bbox.contains_point_batch(np.array([point])).tolist() == [expected]
+
+    @pytest.mark.parametrize(
+        "other,expected",
+        [("overlapping", True), ("far", False), ("box", True)],
+    )
+    def test_intersects(self, canonical_bboxes, other, expected):
+        """Test bounding box intersection, scalar and vectorized."""
+        bbox = canonical_bboxes["cube"]
+        other_box = canonical_bboxes[other]
+        assert bbox.intersects(other_box) is expected
+        assert other_box.intersects(bbox) is expected
+        mins = other_box.as_array()[:3]
+        maxs = other_box.as_array()[3:]
+        assert bbox.intersects_batch(mins, maxs).tolist() == [expected]
+
+    def test_intersects_batch_touching(self, canonical_bboxes):
+        """Test that boxes sharing only a face count as intersecting."""
+        bbox = canonical_bboxes["cube"]
+        mins = np.array([[10.0, -5.0, 0.0], [10.5, 0.0, 0.0]])
+        maxs = np.array([[12.0, 0.0, 1.0], [12.0, 1.0, 1.0]])
+        assert bbox.intersects_batch(mins, maxs).tolist() == [True, False]
+
+
+class TestLinearOctree:
+    """Tests for LinearOctree."""
 
-    def test_intersects(self):
-        """Test bounding box intersection."""
-        bbox1 = BoundingBox(
-            min_point=Vector3(x=0, y=0, z=0),
-            max_point=Vector3(x=10, y=10, z=10),
-        )
-        bbox2 = BoundingBox(
-            min_point=Vector3(x=5, y=5, z=5),
-            max_point=Vector3(x=15, y=15, z=15),
-        )
-        bbox3 = BoundingBox(
-            min_point=Vector3(x=20, y=20, z=20),
-            max_point=Vector3(x=30, y=30, z=30),
+    @pytest.fixture
+    def points(self):
+        """Create a large random point cloud."""
+        rng = np.random.default_rng(7)
+        return rng.uniform(-500, 500, size=(10_000, 3))
+
+    def test_query_box_matches_scan(self, points):
+        """Test box queries against a brute-force scan."""
+        octree = LinearOctree(points)
+        lo = np.array([-120.0, -50.0, 10.0])
+        hi = np.array([80.0, 200.0, 90.0])
+        expected = np.flatnonzero(((lo <= points) & (points <= hi)).all(axis=1))
+        np.testing.assert_array_equal(octree.query_box(lo, hi), expected)
+
+    def test_query_radius_matches_scan(self, points):
+        """Test radius queries against a brute-force scan."""
+        octree = LinearOctree(points)
+        center = np.array([10.0, -20.0, 30.0])
+        expected = np.flatnonzero(((points - center) ** 2).sum(axis=1) <= 75.0**2)
+        np.testing.assert_array_equal(octree.query_radius(center, 75.0), expected)
+
+    def test_empty_and_duplicate_points(self):
+        """Test degenerate inputs."""
+        empty = LinearOctree(np.empty((0, 3)))
+        assert len(empty.query_box(np.zeros(3), np.ones(3))) == 0
+
+        same = LinearOctree(np.ones((100, 3)), leaf_size=4)
+        assert len(same.query_box(np.zeros(3), np.ones(3))) == 100
+
+    def test_reasoner_uses_octree_for_large_worlds(self, monkeypatch):
+        """Test box queries through the reasoner on a world above the threshold."""
+        monkeypatch.setattr(spatial_reasoning, "OCTREE_MIN_ENTITIES", 100)
+        world = WDLWorld(metadata=WDLMetadata(title="Grid"))
+        for i in range(12):
+            for j in range(12):
+                world.add_entity(
+                    WDLEntity(
+                        name=f"E{i}_{j}",
+                        transform=Transform(position=Vector3(x=i * 2, y=0, z=j * 2)),
+                    )
+                )
+
+        reasoner = SpatialReasoner(world)
+        region = BoundingBox(
+            min_point=Vector3(x=3, y=-1, z=0),
+            max_point=Vector3(x=8, y=1, z=4),
         )
-        assert bbox1.intersects(bbox2) is True
-        assert bbox1.intersects(bbox3) is False
+        expected = [e for e in world.entities if region.contains_point(e.transform.position)]
+        assert reasoner.find_entities_in_bounds(region) == expected
+        assert len(expected) == 9
+        assert reasoner._octree is not None
 
 
 class TestSpatialReasoner:
     """Tests for SpatialReasoner."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_world(self):
-        """Create a sample world for testing."""
+        """Create a sample world shared by the tests in this module.
+
+        Tests must not mutate this world; copy it with ``model_copy(deep=True)``
+        first.
+        """
         world = WDLWorld(metadata=WDLMetadata(title="Test"))
         world.add_entity(
             WDLEntity(
@@ -379,21 +847,24 @@ class TestSpatialReasoner:
         )
         return world
 
-    def test_find_nearest_entity(self, sample_world):
+    @pytest.fixture(scope="module")
+    def sample_reasoner(self, sample_world):
+        """Create a spatial reasoner over the shared sample world."""
+        return SpatialReasoner(sample_world)
+
+    def test_find_nearest_entity(self, sample_reasoner):
         """Test finding nearest entity."""
-        reasoner = SpatialReasoner(sample_world)
-        nearest, dist = reasoner.find_nearest_entity(Vector3(x=1, y=0, z=0))
+        nearest, dist = sample_reasoner.find_nearest_entity(Vector3(x=1, y=0, z=0))
         assert nearest is not None
         assert nearest.name == "Entity1"
 
-    def test_find_entities_in_radius(self, sample_world):
+    def test_find_entities_in_radius(self, sample_reasoner):
         """Test finding entities in radius."""
-        reasoner = SpatialReasoner(sample_world)
-        entities = reasoner.find_entities_in_radius(Vector3(x=0, y=0, z=0), radius=8)
+        entities = sample_reasoner.find_entities_in_radius(Vector3(x=0, y=0, z=0), radius=8)
         # Entity1 at origin, Entity3 at (5, 0, 5) = dist ~7.07
         assert len(entities) == 2
 
-    def test_check_collision(self, sample_world):
+    def test_check_collision(self):
         """Test collision detection."""
         # Create overlapping entities
         world = WDLWorld(metadata=WDLMetadata(title="Test"))
@@ -417,10 +888,23 @@ class TestSpatialReasoner:
         reasoner = SpatialReasoner(world)
         assert reasoner.check_collision(entity1, entity2) is True
 
-    def test_get_spatial_analysis(self, sample_world):
+    def test_check_collision_uses_current_entities(self, sample_world):
+        """Test collision checks for moved and unindexed entities."""
+        world = sample_world.model_copy(deep=True)
+        first, second, _ = world.entities
+        reasoner = SpatialReasoner(world)
+        assert reasoner.check_collision(first, second) is False
+
+        outsider = WDLEntity(name="Outsider", transform=Transform(position=Vector3(x=10.5)))
+        assert reasoner.check_collision(second, outsider) is True
+
+        first.transform.position = Vector3(x=9.5, y=0, z=0)
+        reasoner.mark_dirty()
+        assert reasoner.check_collision(first, second) is True
+
+    def test_get_spatial_analysis(self, sample_reasoner):
         """Test spatial analysis."""
-        reasoner = SpatialReasoner(sample_world)
-        analysis = reasoner.get_spatial_analysis()
+        analysis = sample_reasoner.get_spatial_analysis()
 
         assert analysis["entity_count"] == 3
         assert "world_bounds" in analysis
@@ -458,6 +942,23 @@ class TestSpatialReasoner:
         assert bounds.max_point.y == 23.0
         assert bounds.max_point.z == 34.0
 
+    def test_get_world_bounds_updates_after_add(self, sample_world):
+        """Test that cached world bounds follow newly added entities."""
+        world = sample_world.model_copy(deep=True)
+        reasoner = SpatialReasoner(world)
+        bounds = reasoner.get_world_bounds()
+        assert bounds is not None
+        assert bounds.max_point.x == 10.5
+        assert reasoner.get_world_bounds() is bounds
+
+        world.add_entity(
+            WDLEntity(name="Far", transform=Transform(position=Vector3(x=40, y=0, z=0)))
+        )
+        bounds = reasoner.get_world_bounds()
+        assert bounds is not None
+        assert bounds.max_point.x == 40.5
+        assert reasoner.get_spatial_analysis()["world_bounds"]["max"]["x"] == 40.5
+
     def test_find_entities_in_radius_none(self):
         """Test finding entities when none are in radius."""
         world = WDLWorld(metadata=WDLMetadata(title="Test"))
@@ -554,6 +1055,200 @@ class TestSpatialReasoner:
         # Should detect 3 collision pairs: (E1, E2), (E1, E3), (E2, E3)
         assert len(collisions) == 3
 
+    def test_spatial_index_picks_up_new_entities(self):
+        """Test that queries see entities added after the first query."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        world.add_entity(
+            WDLEntity(name="Far", transform=Transform(position=Vector3(x=50, y=0, z=0)))
+        )
+        reasoner = SpatialReasoner(world)
+        nearest, _ = reasoner.find_nearest_entity(Vector3(x=0, y=0, z=0))
+        assert nearest is not None
+        assert nearest.name == "Far"
+
+        world.add_entity(
+            WDLEntity(name="Near", transform=Transform(position=Vector3(x=1, y=0, z=0)))
+        )
+        nearest, dist = reasoner.find_nearest_entity(Vector3(x=0, y=0, z=0))
+        assert nearest is not None
+        assert nearest.name == "Near"
+        assert dist == 1.0
+
+    def test_radius_query_after_appending_entities(self):
+        """Test that incrementally indexed entities match a brute-force scan."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        reasoner = SpatialReasoner(world)
+        center = Vector3(x=5, y=0, z=5)
+        for batch in range(4):
+            for i in range(30):
+                world.add_entity(
+                    WDLEntity(
+                        name=f"E{batch}_{i}",
+                        transform=Transform(position=Vector3(x=i, y=batch, z=i % 7)),
+                    )
+                )
+            expected = [
+                e for e in world.entities if distance(center, e.transform.position) <= 6
+            ]
+            assert reasoner.find_entities_in_radius(center, 6) == expected
+
+        # Replacing the tail is not an append and must trigger a full rebuild.
+        world.entities[-1] = WDLEntity(
+            name="Moved", transform=Transform(position=Vector3(x=5, y=0, z=5))
+        )
+        world.add_entity(WDLEntity(name="Extra", transform=Transform(position=Vector3(x=99))))
+        assert reasoner.find_entities_in_radius(center, 0)[-1].name == "Moved"
+
+    def test_remove_then_add_rebuilds_index(self):
+        """Test that a removal followed by an add is not mistaken for no change."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        first = WDLEntity(name="A", transform=Transform(position=Vector3(x=0)))
+        world.add_entity(first)
+        world.add_entity(WDLEntity(name="B", transform=Transform(position=Vector3(x=10))))
+        reasoner = SpatialReasoner(world)
+        assert reasoner.find_nearest_entity(Vector3(x=0))[0].name == "A"
+
+        world.remove_entity(first.id)
+        world.add_entity(WDLEntity(name="C", transform=Transform(position=Vector3(x=1))))
+        nearest, dist = reasoner.find_nearest_entity(Vector3(x=0))
+        assert nearest is not None
+        assert nearest.name == "C"
+        assert dist == 1.0
+
+        world.entities = [WDLEntity(name="D", transform=Transform(position=Vector3(x=2)))]
+        assert reasoner.find_nearest_entity(Vector3(x=0))[0].name == "D"
+
+    def test_mark_dirty_after_moving_entity(self):
+        """Test that moved entities are seen after marking the reasoner dirty."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        entity = WDLEntity(name="Mover", transform=Transform(position=Vector3(x=0, y=0, z=0)))
+        world.add_entity(entity)
+        reasoner = SpatialReasoner(world)
+        assert len(reasoner.find_entities_in_radius(Vector3(x=0, y=0, z=0), radius=1)) == 1
+
+        entity.transform.position = Vector3(x=20, y=0, z=0)
+        reasoner.mark_dirty()
+        assert reasoner.find_entities_in_radius(Vector3(x=0, y=0, z=0), radius=1) == []
+        bounds = reasoner.get_world_bounds()
+        assert bounds is not None
+        assert bounds.min_point.x == 19.5
+
+    def test_refresh_rebuilds_snapshot(self):
+        """Test that refresh picks up replaced entities eagerly."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        world.add_entity(WDLEntity(name="Old", transform=Transform(position=Vector3(x=0))))
+        reasoner = SpatialReasoner(world)
+        assert reasoner.find_nearest_entity(Vector3(x=0))[0].name == "Old"
+
+        world.entities[0] = WDLEntity(name="New", transform=Transform(position=Vector3(x=3)))
+        reasoner.refresh()
+        nearest, dist = reasoner.find_nearest_entity(Vector3(x=0))
+        assert nearest is not None
+        assert nearest.name == "New"
+        assert dist == 3.0
+        assert reasoner.get_spatial_analysis()["entity_count"] == 1
+
+    def test_queries_match_brute_force_on_grid(self):
+        """Test indexed queries against a brute-force scan on a larger world."""
+        world = WDLWorld(metadata=WDLMetadata(title="Grid"))
+        for i in range(10):
+            for j in range(10):
+                world.add_entity(
+                    WDLEntity(
+                        name=f"E{i}_{j}",
+                        transform=Transform(position=Vector3(x=i * 3, y=0, z=j * 2)),
+                    )
+                )
+
+        reasoner = SpatialReasoner(world)
+        center = Vector3(x=7.5, y=0, z=4.2)
+
+        expected = [e for e in world.entities if distance(center, e.transform.position) <= 6]
+        assert reasoner.find_entities_in_radius(center, radius=6) == expected
+
+        nearest, dist = reasoner.find_nearest_entity(center)
+        best = min(world.entities, key=lambda e: distance(center, e.transform.position))
+        assert nearest is not None
+        assert dist == pytest.approx(distance(center, best.transform.position))
+
+    def test_detect_collisions_large_world_matches_pairwise(self):
+        """Test BVH broad-phase against the plain pairwise check."""
+        world = WDLWorld(metadata=WDLMetadata(title="Row"))
+        for i in range(40):
+            world.add_entity(
+                WDLEntity(
+                    name=f"E{i}",
+                    transform=Transform(
+                        position=Vector3(x=i * 1.5, y=0, z=(i % 3) * 1.5),
+                        scale=Vector3(x=2, y=2, z=2),
+                    ),
+                )
+            )
+
+        reasoner = SpatialReasoner(world)
+        entities = world.entities
+        expected = [
+            (a, b)
+            for i, a in enumerate(entities)
+            for b in entities[i + 1 :]
+            if reasoner.check_collision(a, b)
+        ]
+        assert len(expected) > 0
+        assert reasoner.find_all_collisions() == expected
+
+        first = entities[0]
+        assert reasoner.find_colliding_entities(first) == [
+            e for e in entities if e.id != first.id and reasoner.check_collision(first, e)
+        ]
+        assert reasoner.count_collisions() == len(expected)
+
+    def test_count_collisions(self):
+        """Test counting collisions, including touching and nested boxes."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        reasoner = SpatialReasoner(world)
+        assert reasoner.count_collisions() == 0
+
+        for name, x, size in [("A", 0, 2), ("B", 2, 2), ("C", 0, 0.5), ("D", 10, 1)]:
+            world.add_entity(
+                WDLEntity(
+                    name=name,
+                    transform=Transform(
+                        position=Vector3(x=x, y=0, z=0),
+                        scale=Vector3(x=size, y=size, z=size),
+                    ),
+                )
+            )
+        assert reasoner.count_collisions() == len(reasoner.find_all_collisions()) == 2
+
+    def test_overlap_kernel_only_above_pair_threshold(self, monkeypatch):
+        """Test the numba kernel is skipped for few pairs and agrees with NumPy."""
+        kernel_calls = []
+
+        def kernel(aabb_min, aabb_max, pairs):
+            kernel_calls.append(len(pairs))
+            if real_kernel is not None:
+                return real_kernel(aabb_min, aabb_max, pairs)
+            i, j = pairs[:, 0], pairs[:, 1]
+            return np.all((aabb_min[i] <= aabb_max[j]) & (aabb_max[i] >= aabb_min[j]), axis=1)
+
+        real_kernel = spatial_reasoning._overlapping_pairs_nb
+        monkeypatch.setattr(spatial_reasoning, "_overlapping_pairs_nb", kernel)
+
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        for i in range(40):
+            world.add_entity(
+                WDLEntity(name=f"E{i}", transform=Transform(position=Vector3(x=i * 0.7, z=i % 3)))
+            )
+        reasoner = SpatialReasoner(world)
+        expected = reasoner.find_all_collisions()
+        assert expected
+        assert kernel_calls == []
+
+        monkeypatch.setattr(spatial_reasoning, "NUMBA_MIN_CANDIDATE_PAIRS", 1)
+        assert reasoner.find_all_collisions() == expected
+        assert reasoner.count_collisions() == len(expected)
+        assert len(kernel_calls) == 2
+
     def test_suggest_placement_empty_world(self):
         """Test suggesting placement in empty world."""
         world = WDLWorld(metadata=WDLMetadata(title="Empty"))
@@ -593,6 +1288,28 @@ class TestSpatialReasoner:
             dist = distance(position, Vector3(x=0, y=0, z=0))
             assert dist >= 3.0
 
+    def test_suggest_placement_in_crowded_world(self):
+        """Test that placement skips occupied rings and keeps the spacing."""
+        world = WDLWorld(metadata=WDLMetadata(title="Crowded"))
+        for i in range(-5, 6):
+            for j in range(-5, 6):
+                world.add_entity(
+                    WDLEntity(
+                        name=f"E{i}_{j}",
+                        transform=Transform(position=Vector3(x=i * 1.5, y=0, z=j * 1.5)),
+                    )
+                )
+
+        reasoner = SpatialReasoner(world)
+        position = reasoner.suggest_placement(
+            size=Vector3(x=1, y=1, z=1), min_distance_from_others=2.0, preferred_y=0.0
+        )
+        assert position is not None
+        assert position.y == 0.0
+        nearest, dist = reasoner.find_nearest_entity(position)
+        assert nearest is not None
+        assert dist >= 2.0
+
 
 class TestDistanceFunctions:
     """Tests for distance helper functions."""
@@ -608,3 +1325,34 @@ class TestDistanceFunctions:
         p1 = Vector3(x=0, y=0, z=0)
         p2 = Vector3(x=3, y=4, z=0)
         assert distance_squared(p1, p2) == 25.0
+
+    def test_distance_batch(self):
+        """Test batched distance against a single query point."""
+        query = np.array([0.0, 0.0, 0.0])
+        points = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 2.0]])
+        np.testing.assert_allclose(distance_batch(query, points), [5.0, 2.0])
+        np.testing.assert_allclose(distance(query, points), [5.0, 2.0])
+
+    def test_distance_squared_batch(self):
+        """Test batched squared distance over paired rows."""
+        points_a = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+        points_b = np.array([[3.0, 4.0, 0.0], [1.0, 1.0, 3.0]])
+        np.testing.assert_allclose(distance_squared_batch(points_a, points_b), [25.0, 4.0])
+        np.testing.assert_allclose(distance_squared(points_a, points_b), [25.0, 4.0])
+
+    def test_distance_squared_batch_matches_scalar(self):
+        """Test single-point batches agree exactly with the scalar function."""
+        rng = np.random.default_rng(3)
+        query = rng.uniform(-100, 100, 3)
+        points = rng.uniform(-100, 100, (50, 3))
+        q = Vector3(x=query[0], y=query[1], z=query[2])
+        expected = [distance_squared(q, Vector3(x=x, y=y, z=z)) for x, y, z in points.tolist()]
+        assert distance_squared_batch(query, points).tolist() == expected
+        assert float(distance_squared_batch(query, points[0])) == expected[0]
+
+    def test_distance_squared_arr(self):
+        """Test squared distances from an array of positions to a Vector3."""
+        positions = np.array([[3.0, 4.0, 0.0], [1.0, 1.0, 3.0]])
+        result = distance_squared_arr(positions, Vector3(x=1, y=1, z=1))
+        np.testing.assert_array_equal(result, [14.0, 4.0])
+        assert result[0] == distance_squared(Vector3(x=3, y=4, z=0), Vector3(x=1, y=1, z=1))
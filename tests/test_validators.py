@@ -179,6 +179,71 @@ class TestWDLValidator:
 
         assert any("Custom rule triggered" in w.message for w in result.get_warnings())
 
+    def test_add_custom_entity_rule(self):
+        """Test that entity rules run once per entity with the shared context."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        parent = WDLEntity(name="Parent")
+        world.add_entity(parent)
+        world.add_entity(WDLEntity(name="Child", parent_id=parent.id))
+
+        seen = []
+
+        def custom_rule(entity, context):
+            seen.append(entity.name)
+            assert parent.id in context.entity_ids
+            return [
+                ValidationIssue(
+                    severity=ValidationSeverity.INFO,
+                    message=f"Checked {entity.name}",
+                    entity_id=entity.id,
+                )
+            ]
+
+        validator = WDLValidator()
+        validator.add_entity_rule(custom_rule)
+        result = validator.validate(world)
+
+        assert seen == ["Parent", "Child"]
+        assert [i.message for i in result.issues] == ["Checked Parent", "Checked Child"]
+        assert result.is_valid is True
+
+    def test_duplicate_ids_reported_once_per_repeat(self):
+        """Test that only repeated occurrences of an ID are flagged."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        first = WDLEntity(name="First")
+        world.add_entity(first)
+        for name in ("Second", "Third"):
+            duplicate = WDLEntity(name=name)
+            duplicate.id = first.id
+            world.add_entity(duplicate)
+
+        validator = WDLValidator()
+        result = validator.validate(world)
+        assert len(result.get_errors()) == 2
+        # Each validation pass starts from a fresh context.
+        assert validator.validate(world).issues == result.issues
+
+    def test_issues_reported_in_rule_order(self):
+        """Test that issues are grouped by rule, in the built-in rule order."""
+        world = WDLWorld(metadata=WDLMetadata(title="Test"))
+        world.add_entity(
+            WDLEntity(
+                name="Falling",
+                physics=PhysicsSettings(enabled=True, mass=0),
+                transform=Transform(position=Vector3(x=5000, y=0, z=0)),
+            )
+        )
+        world.add_entity(WDLEntity(name="Orphan", parent_id="missing"))
+        world.add_light(Lighting(name="Sun", intensity=500))
+
+        result = WDLValidator().validate(world)
+        assert [i.field_path for i in result.issues] == [
+            "parent_id",
+            "transform.position",
+            "intensity",
+            "physics.mass",
+        ]
+
     def test_validate_wdl_convenience_function(self):
         """Test the convenience validate_wdl function."""
         world = WDLWorld(metadata=WDLMetadata(title="Test"))
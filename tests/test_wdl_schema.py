@@ -1,5 +1,11 @@
 """Tests for the WDL schema."""
 
+import sys
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
 from omniworld_builder.core.wdl_schema import (
     Color,
     EntityType,
@@ -13,6 +19,7 @@ from omniworld_builder.core.wdl_schema import (
     WDLEntity,
     WDLEnvironment,
     WDLMetadata,
+    WDLSystem,
     WDLWorld,
     WeatherType,
 )
@@ -35,6 +42,35 @@ class TestVector3:
         assert v.y == 2.0
         assert v.z == 3.0
 
+    def test_coerces_and_is_immutable(self):
+        """Test Vector3 float coercion and immutability."""
+        v = Vector3(x=1, y="2.5", z=0)
+        assert v.x == 1.0
+        assert isinstance(v.x, float)
+        assert v.y == 2.5
+        with pytest.raises(AttributeError):
+            v.x = 5.0  # type: ignore[misc]
+
+    def test_nested_validation(self):
+        """Test Vector3 validation and serialization inside a model."""
+        t = Transform.model_validate({"position": {"x": 1, "y": 2, "z": 3}})
+        assert t.position == Vector3(x=1.0, y=2.0, z=3.0)
+        assert t.model_dump()["position"] == {"x": 1.0, "y": 2.0, "z": 3.0}
+
+    def test_model_api_compatibility(self):
+        """Test the BaseModel-style methods accept the usual options."""
+        v = Vector3.model_validate({"x": 1, "y": 2, "z": 3, "w": 4})
+        assert v == Vector3(x=1.0, y=2.0, z=3.0)
+        assert v.model_dump(mode="json") == {"x": 1.0, "y": 2.0, "z": 3.0}
+        assert v.model_dump(include={"x"}) == {"x": 1.0}
+        assert Transform(position=v).model_dump(exclude_defaults=True) == {
+            "position": {"x": 1.0, "y": 2.0, "z": 3.0}
+        }
+        with pytest.raises(ValidationError):
+            Vector3(x="abc")
+        with pytest.raises(ValidationError):
+            Vector3.model_validate([1, 2, 3])
+
 
 class TestColor:
     """Tests for Color model."""
@@ -53,6 +89,19 @@ class TestColor:
         assert c.r == 0.5
         assert c.g == 0.5
 
+    def test_rejects_out_of_range_channel(self):
+        """Test Color range checks, directly and inside a model."""
+        with pytest.raises(ValidationError):
+            Color(r=1.5)
+        with pytest.raises(ValidationError):
+            Lighting(name="Bad", color={"g": -0.1})
+
+    def test_bounds_in_json_schema(self):
+        """Test channel bounds appear in the schemas of embedding models."""
+        schema = WDLEntity.model_json_schema()["$defs"]["Color"]["properties"]["r"]
+        assert schema["minimum"] == 0.0
+        assert schema["maximum"] == 1.0
+
 
 class TestTransform:
     """Tests for Transform model."""
@@ -64,6 +113,19 @@ class TestTransform:
         assert t.rotation.x == 0.0
         assert t.scale.x == 1.0
 
+    def test_defaults_are_shared_but_independent(self):
+        """Test default vectors are shared instances that assignment never leaks."""
+        a, b = Transform(), Transform()
+        assert a.position is b.position
+        a.position = Vector3(x=5.0)
+        assert b.position == Vector3()
+
+    def test_accepts_vector_dicts(self):
+        """Test Transform coerces dictionaries and round-trips via model_dump."""
+        t = Transform(position={"x": 1, "y": 2, "z": 3})
+        assert t.position == Vector3(x=1.0, y=2.0, z=3.0)
+        assert Transform.model_validate(t.model_dump()) == t
+
 
 class TestWDLEntity:
     """Tests for WDLEntity model."""
@@ -75,6 +137,12 @@ class TestWDLEntity:
         assert entity.entity_type == EntityType.STATIC_MESH
         assert entity.id is not None
 
+    def test_default_ids_are_unique_uuid4(self):
+        """Test generated ids are distinct and parse as version 4 UUIDs."""
+        ids = {WDLEntity(name="TestEntity").id for _ in range(1000)}
+        assert len(ids) == 1000
+        assert {uuid.UUID(entity_id).version for entity_id in ids} == {4}
+
     def test_entity_with_transform(self):
         """Test entity with custom transform."""
         entity = WDLEntity(
@@ -105,6 +173,27 @@ class TestWDLEntity:
         assert entity.physics.enabled is True
         assert entity.physics.mass == 10.0
 
+    def test_physics_settings_validation(self):
+        """Test physics coefficients are coerced and range-checked."""
+        entity = WDLEntity.model_validate({"name": "Crate", "physics": {"mass": 2}})
+        assert entity.physics.mass == 2.0
+        assert isinstance(entity.physics.mass, float)
+        with pytest.raises(ValidationError):
+            WDLEntity.model_validate({"name": "Crate", "physics": {"drag": -1}})
+
+    def test_physics_settings_flags(self):
+        """Test physics flags parse like Pydantic bools and reject other values."""
+        physics = PhysicsSettings(enabled="false", use_gravity="yes", collision_enabled=0)
+        assert physics.enabled is False
+        assert physics.use_gravity is True
+        assert physics.collision_enabled is False
+        entity = WDLEntity.model_validate({"name": "Crate", "physics": {"is_kinematic": "on"}})
+        assert entity.physics.is_kinematic is True
+        with pytest.raises(ValueError):
+            PhysicsSettings(enabled="maybe")
+        with pytest.raises(ValueError):
+            PhysicsSettings(use_gravity=2)
+
     def test_entity_tags(self):
         """Test entity tags."""
         entity = WDLEntity(name="TestEntity", tags=["tag1", "tag2"])
@@ -211,6 +300,116 @@ class TestWDLWorld:
         vegetation = world.get_entities_by_tag("vegetation")
         assert len(vegetation) == 2
 
+    def test_lookups_track_list_edits(self):
+        """Test lookups after loading, direct appends and reindex."""
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        tree = WDLEntity(name="Tree", tags=["vegetation", "vegetation"])
+        world.add_entity(tree)
+
+        loaded = WDLWorld.from_json(world.to_json())
+        assert loaded.get_entity_by_id(tree.id).name == "Tree"
+        assert len(loaded.get_entities_by_tag("vegetation")) == 1
+
+        rock = WDLEntity(name="Rock", entity_type=EntityType.PROP)
+        world.entities.append(rock)
+        assert world.get_entity_by_id(rock.id) is rock
+        assert world.get_entities_by_type(EntityType.PROP) == [rock]
+
+        rock.tags.append("".join(["min", "eral"]))
+        world.reindex()
+        assert world.get_entities_by_tag("mineral") == [rock]
+        assert rock.tags[0] is sys.intern("mineral")
+
+    def test_lookups_survive_same_length_edits(self):
+        """Test id lookups after replacing the list, swapping items and renaming ids."""
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        old = WDLEntity(name="Old", tags=["a"])
+        world.add_entity(old)
+
+        new = WDLEntity(name="New", tags=["a"])
+        world.entities = [new]
+        assert world.get_entity_by_id(new.id) is new
+        assert world.get_entity_by_id(old.id) is None
+        assert world.get_entities_by_tag("a") == [new]
+
+        swapped = WDLEntity(name="Swapped")
+        world.entities[0] = swapped
+        assert world.get_entity_by_id(new.id) is None
+        assert world.get_entities_by_tag("a") == []
+        assert world.get_entity_by_id(swapped.id) is swapped
+
+        previous_id = swapped.id
+        swapped.id = "renamed"
+        assert world.get_entity_by_id("renamed") is swapped
+        assert world.get_entity_by_id(previous_id) is None
+
+    def test_type_and_tag_lookups_see_in_place_edits(self):
+        """Test type and tag lookups reflect entities edited in place."""
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        entity = WDLEntity(name="Bush", entity_type=EntityType.STATIC_MESH)
+        world.add_entity(entity)
+        assert world.get_entities_by_tag("veg") == []
+
+        entity.tags.append("veg")
+        assert world.get_entities_by_tag("veg") == [entity]
+
+        entity.entity_type = EntityType.PROP
+        assert world.get_entities_by_type(EntityType.PROP) == [entity]
+        assert world.get_entities_by_type(EntityType.STATIC_MESH) == []
+
+        swapped = WDLEntity(name="Swapped", tags=["x"])
+        world.entities[0] = swapped
+        assert world.get_entities_by_tag("x") == [swapped]
+
+    def test_equality_ignores_lookup_index(self):
+        """Test equality does not depend on whether the index is up to date."""
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        world.add_entity(WDLEntity(name="Indexed"))
+        world.entities.append(WDLEntity(name="Appended"))
+
+        assert WDLWorld.from_json(world.to_json()) == world
+
+    def test_remove_entity(self):
+        """Test removal updates the list and every lookup index."""
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        tree = WDLEntity(name="Tree", tags=["vegetation"])
+        bush = WDLEntity(name="Bush", tags=["vegetation"])
+        twin = WDLEntity(id=tree.id, name="Twin")
+        for entity in (tree, bush, twin):
+            world.add_entity(entity)
+
+        assert world.remove_entity(tree.id) is tree
+        assert world.entities == [bush, twin]
+        assert world.get_entities_by_tag("vegetation") == [bush]
+        assert world.get_entity_by_id(tree.id) is twin
+        assert world.remove_entity("missing") is None
+
+    def test_extend_entities_from_dicts(self):
+        """Test the bulk path rebuilds equal entities and rejects bad ones."""
+        source = [
+            WDLEntity(
+                name=f"Crate{i}",
+                entity_type=EntityType.PROP,
+                transform=Transform(position=Vector3(x=i, y=0, z=2 * i)),
+                material=Material(name="Wood", base_color=Color(r=0.4, g=0.3, b=0.2)),
+                physics=PhysicsSettings(enabled=True, mass=5.0),
+                tags=["crate"],
+            )
+            for i in range(3)
+        ]
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        for mode in ("python", "json"):
+            world.entities.clear()
+            world.reindex()
+            assert world.extend_entities(e.model_dump(mode=mode) for e in source) == 3
+            assert world.entities == source
+            assert world.get_entity_by_id(source[1].id).transform.position.z == 2.0
+            assert len(world.get_entities_by_type(EntityType.PROP)) == 3
+
+        with pytest.raises(ValidationError):
+            world.extend_entities([{"name": "Ok"}, {"name": "Bad", "physics": {"mass": -1}}])
+        assert len(world.entities) == 3
+
     def test_json_serialization(self):
         """Test JSON serialization and deserialization."""
         metadata = WDLMetadata(title="TestWorld", description="A test")
@@ -226,6 +425,43 @@ class TestWDLWorld:
         assert loaded.metadata.title == "TestWorld"
         assert len(loaded.entities) == 1
 
+    def test_json_is_compact_with_pretty_variant(self):
+        """Test to_json is compact and to_json_pretty is the same document indented."""
+        world = WDLWorld(metadata=WDLMetadata(title="TestWorld"))
+        world.add_entity(WDLEntity(name="TestEntity"))
+
+        compact, pretty = world.to_json(), world.to_json_pretty()
+        assert "\n" not in compact
+        assert '\n  "metadata": {' in pretty
+        assert WDLWorld.from_json(compact) == WDLWorld.from_json(pretty) == world
+
+    def test_json_bytes_matches_text(self):
+        """Test the bytes export is the UTF-8 encoding of the text export."""
+        world = WDLWorld(metadata=WDLMetadata(title="BytesWorld"))
+        world.add_entity(WDLEntity(name="Café", transform=Transform(position=Vector3(x=1))))
+
+        data = world.to_json_bytes()
+        assert isinstance(data, bytes)
+        assert data == world.to_json().encode()
+
+        loaded = WDLWorld.from_json(data)
+        assert loaded.entities[0].name == "Café"
+        assert loaded.entities[0].transform.position.x == 1
+
+    def test_write_and_read_json_file(self, tmp_path):
+        """Test the file helpers write the same document as to_json or to_json_pretty."""
+        world = WDLWorld(metadata=WDLMetadata(title="FileWorld"))
+        world.add_entity(WDLEntity(name="Café"))
+        path = tmp_path / "world.json"
+
+        world.write_json(path)
+        assert path.read_text(encoding="utf-8") == world.to_json()
+        assert WDLWorld.read_json(str(path)) == world
+
+        world.write_json(path, indent=2)
+        assert path.read_text(encoding="utf-8") == world.to_json_pretty()
+        assert WDLWorld.read_json(path) == world
+
     def test_json_roundtrip_with_transform(self):
         """Test JSON round-trip with entity transforms."""
         metadata = WDLMetadata(title="TransformTest", description="Test transforms")
@@ -314,3 +550,19 @@ class TestWDLWorld:
         assert len(loaded.lights) == 1
         assert len(loaded.systems) == 1
         assert loaded.systems[0].name == "TestSystem"
+
+    def test_msgpack_roundtrip(self):
+        """Test MessagePack round-trip matches the source world."""
+        pytest.importorskip("msgspec")
+
+        world = WDLWorld(metadata=WDLMetadata(title="PackedWorld"))
+        world.add_entity(
+            WDLEntity(name="Crate", tags=["prop"], transform=Transform(position=Vector3(x=3)))
+        )
+        world.add_light(Lighting(name="Sun", color=Color(r=1.0, g=0.9, b=0.7)))
+        world.add_system(WDLSystem(name="Spawner", description="Spawns crates"))
+
+        data = world.to_msgpack()
+        assert isinstance(data, bytes)
+        assert len(data) < len(world.to_json_bytes())
+        assert WDLWorld.from_msgpack(data) == world